@@ -4,14 +4,31 @@ Stellar Defense Level Configuration Editor
 A console-based spreadsheet-like interface for editing game levels
 """
 
+import gc
+import glob
 import json
+import math
+import mmap
+import random
 import re
 import os
+import shutil
+import struct
 import sys
+import time
+import termios
+import tty
+import csv
 import curses
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
-from tabulate import tabulate
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import accumulate, islice
+from operator import attrgetter
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from dataclasses import MISSING, dataclass, asdict, fields
 
 @dataclass
 class GlobalConfig:
@@ -29,81 +46,1345 @@ class LevelConfig:
     allowedEnemyTypes: List[int]
     global_config: GlobalConfig
 
+# Flat field order used for level records (hashable tuples) in diffs and merges
+GLOBAL_FIELDS = [f.name for f in fields(GlobalConfig)]
+LEVEL_FIELDS = ['name', 'allowedEnemyTypes'] + GLOBAL_FIELDS
+_global_values = attrgetter(*GLOBAL_FIELDS)
+
+JS_HEADER = '''/**
+ * Level configuration object that defines the behavior and parameters for each game level.
+ * Each level has a unique configuration for different enemy types and global settings.
+ * 
+ * Structure:
+ * {
+ *   [levelNumber]: {
+ *     name: string,              // Display name of the level (e.g. "1 Alpha")
+ *     allowedEnemyTypes: number[], // Array of allowed enemy types (1, 2, 3)
+ *     global: {                  // Global level settings
+ *       maxEnemies: number,      // Maximum number of enemies allowed in the level
+ *       spawnTimeWindow: number, // Time window in seconds to spawn all enemies
+ *       collisionSeparation: number, // Force applied to separate colliding enemies
+ *       wrapBuffer: number,      // Distance from top before enemies wrap around
+ *       speedMultiplier: number, // Multiplier applied to all enemy speeds
+ *       eccentricityMultiplier: number // Multiplier for enemy direction change probability
+ *     }
+ *   }
+ * }
+ */
+const levelConfigs = {
+'''
+
+_KEY_PATTERN = re.compile(r'(?<=[{,])(\s*)(\w+):')
+
+def _load_level_data(filename: str) -> Dict[str, Any]:
+    """Parse the levelConfigs object of a level_config.js file into plain JSON data"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    # Locate the levelConfigs object; it ends at the first "};" after its opening brace
+    match = re.search(r'const\s+levelConfigs\s*=\s*\{', content)
+    end = content.find('};', match.end()) if match else -1
+
+    if end < 0:
+        raise ValueError(f"Could not find levelConfigs object in {filename}")
+
+    js_object = content[match.end() - 1:end + 1]
+
+    # Convert JavaScript object notation to JSON
+    # Handle comments (remove them) - do this first
+    js_object = re.sub(r'//.*?$', '', js_object, flags=re.MULTILINE)
+    # Replace single quotes with double quotes
+    js_object = re.sub(r"'([^']*)'", r'"\1"', js_object)
+    # Handle property names without quotes (keys always follow "{" or ",";
+    # splitting avoids a template expansion per key on large files)
+    pieces = _KEY_PATTERN.split(js_object)
+    pieces[2::3] = [f'"{key}":' for key in pieces[2::3]]
+    js_object = ''.join(pieces)
+    # Fix decimal numbers starting with dot (e.g., .6 -> 0.6)
+    js_object = re.sub(r'\.(?<=[\s:]\.)(\d)', r'0.\1', js_object)
+    # Remove trailing commas before closing braces/brackets
+    js_object = re.sub(r',(?=\s*[}\]])', '', js_object)
+
+    try:
+        data = json.loads(js_object)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Error parsing JavaScript object: {e}") from e
+
+    return data
+
+def read_level_configs(filename: str) -> Dict[int, LevelConfig]:
+    """Parse a level_config.js file into level configs, raising ValueError on bad content"""
+    data = _load_level_data(filename)
+
+    # Convert to our data structure
+    levels: Dict[int, LevelConfig] = {}
+    for level_num_str, level_data in data.items():
+        level_num = int(level_num_str)
+        global_data = level_data['global']
+
+        global_config = GlobalConfig(
+            maxEnemies=global_data['maxEnemies'],
+            spawnTimeWindow=global_data['spawnTimeWindow'],
+            collisionSeparation=global_data['collisionSeparation'],
+            wrapBuffer=global_data['wrapBuffer'],
+            speedMultiplier=global_data['speedMultiplier'],
+            eccentricityMultiplier=global_data['eccentricityMultiplier'],
+            scoreBonus=global_data.get('scoreBonus', 0)
+        )
+
+        levels[level_num] = LevelConfig(
+            name=level_data['name'],
+            allowedEnemyTypes=level_data['allowedEnemyTypes'],
+            global_config=global_config
+        )
+
+    return levels
+
+def write_level_configs(filename: str, levels: Dict[int, LevelConfig]):
+    """Write level configs to a level_config.js file"""
+    parts = [JS_HEADER]
+    sorted_nums = sorted(levels.keys())
+    last_num = sorted_nums[-1] if sorted_nums else None
+
+    for level_num in sorted_nums:
+        level = levels[level_num]
+        config = level.global_config
+        parts.append(
+            f'    {level_num}: {{\n'
+            f'        name: "{level.name}",\n'
+            f'        allowedEnemyTypes: {level.allowedEnemyTypes},\n'
+            f'        global: {{\n'
+            f'            maxEnemies: {config.maxEnemies},\n'
+            f'            spawnTimeWindow: {config.spawnTimeWindow},\n'
+            f'            collisionSeparation: {config.collisionSeparation},\n'
+            f'            wrapBuffer: {config.wrapBuffer},\n'
+            f'            speedMultiplier: {config.speedMultiplier},\n'
+            f'            eccentricityMultiplier: {config.eccentricityMultiplier}'
+        )
+
+        if config.scoreBonus > 0:
+            parts.append(f',\n            scoreBonus: {config.scoreBonus}')
+
+        parts.append('\n        }\n    }')
+        if level_num != last_num:
+            parts.append(',')
+        parts.append('\n')
+
+    parts.append('}; \n')
+
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(''.join(parts))
+
+def level_to_record(level: LevelConfig) -> Tuple:
+    """Flatten a level into a hashable tuple ordered like LEVEL_FIELDS"""
+    return (level.name, tuple(level.allowedEnemyTypes)) + _global_values(level.global_config)
+
+def record_to_level(record: Tuple) -> LevelConfig:
+    """Rebuild a LevelConfig from a record produced by level_to_record"""
+    return LevelConfig(
+        name=record[0],
+        allowedEnemyTypes=list(record[1]),
+        global_config=GlobalConfig(*record[2:])
+    )
+
+def read_level_records(filename: str) -> Dict[int, Tuple]:
+    """Parse a level_config.js file straight into level records, skipping the dataclasses"""
+    records = {}
+    for level_num_str, level_data in _load_level_data(filename).items():
+        global_data = level_data['global']
+        records[int(level_num_str)] = (
+            level_data['name'],
+            tuple(level_data['allowedEnemyTypes']),
+            global_data['maxEnemies'],
+            global_data['spawnTimeWindow'],
+            global_data['collisionSeparation'],
+            global_data['wrapBuffer'],
+            global_data['speedMultiplier'],
+            global_data['eccentricityMultiplier'],
+            global_data.get('scoreBonus', 0)
+        )
+    return records
+
+def levels_to_records(levels: Dict[int, LevelConfig]) -> Dict[int, Tuple]:
+    return {level_num: level_to_record(level) for level_num, level in levels.items()}
+
+def _changed_levels(a: Dict[int, Tuple], b: Dict[int, Tuple]) -> set:
+    """Level numbers whose record differs between a and b (added, removed or edited).
+
+    The symmetric difference of the item views hashes each (level, record) pair once,
+    so unchanged levels drop out in linear time without a field-by-field comparison.
+    """
+    return {level_num for level_num, _ in a.items() ^ b.items()}
+
+def diff_level_records(old: Dict[int, Tuple], new: Dict[int, Tuple]) -> List[Tuple[int, Optional[str], Any, Any]]:
+    """Field-level differences between two record maps.
+
+    Returns (level, field, old_value, new_value) entries. Added or removed levels are
+    reported with field None and the whole record (or None) as the value.
+    """
+    changes = []
+    for level_num in sorted(_changed_levels(old, new)):
+        a = old.get(level_num)
+        b = new.get(level_num)
+        if a is None or b is None:
+            changes.append((level_num, None, a, b))
+            continue
+        for field, old_value, new_value in zip(LEVEL_FIELDS, a, b):
+            if old_value != new_value:
+                changes.append((level_num, field, old_value, new_value))
+    return changes
+
+def merge_level_records(base: Dict[int, Tuple], ours: Dict[int, Tuple],
+                        theirs: Dict[int, Tuple]) -> Tuple[Dict[int, Tuple], List[Tuple[int, Optional[str], Any, Any]]]:
+    """Three-way merge of record maps by level number and field.
+
+    Non-overlapping changes are combined. When both sides change the same field
+    differently the ours value is kept and a (level, field, ours, theirs) conflict
+    is reported; a level deleted on one side and edited on the other is kept and
+    reported with field None.
+    """
+    merged = dict(ours)
+    conflicts = []
+    ours_changed = _changed_levels(base, ours)
+
+    for level_num in sorted(_changed_levels(base, theirs)):
+        b = base.get(level_num)
+        o = ours.get(level_num)
+        t = theirs.get(level_num)
+
+        if level_num not in ours_changed:
+            if t is None:
+                del merged[level_num]
+            else:
+                merged[level_num] = t
+        elif o == t:
+            continue
+        elif o is None or t is None or b is None:
+            # Delete/edit or add/add with different content
+            merged[level_num] = o if o is not None else t
+            conflicts.append((level_num, None, o, t))
+        else:
+            values = []
+            for field, b_value, o_value, t_value in zip(LEVEL_FIELDS, b, o, t):
+                if o_value == t_value or t_value == b_value:
+                    values.append(o_value)
+                elif o_value == b_value:
+                    values.append(t_value)
+                else:
+                    values.append(o_value)
+                    conflicts.append((level_num, field, o_value, t_value))
+            merged[level_num] = tuple(values)
+
+    return merged, conflicts
+
+def format_change(level_num: int, field: Optional[str], old_value: Any, new_value: Any) -> str:
+    """Render one diff or conflict entry as a single line"""
+    if field is not None:
+        return f"~ level {level_num} {field}: {old_value} -> {new_value}"
+    if old_value is None:
+        return f"+ level {level_num} '{new_value[0]}'"
+    if new_value is None:
+        return f"- level {level_num} '{old_value[0]}'"
+    return f"! level {level_num}: {old_value} <> {new_value}"
+
+# Mirrors enemyBaseConfig in enemy_manager.js and the gameCanvas size in index.html
+ENEMY_BASE_CONFIG = {
+    1: {'speedX': (1.0, 2.5), 'speedY': (0.6, 1.2), 'points': 20, 'width': 22, 'height': 22,
+        'directionChangeProbability': 0.008, 'reverseMovementProbability': 0.0},
+    2: {'speedX': (0.5, 1.5), 'speedY': (0.7, 1.3), 'points': 30, 'width': 26, 'height': 26,
+        'directionChangeProbability': 0.012, 'reverseMovementProbability': 0.0},
+    3: {'speedX': (1.0, 2.0), 'speedY': (0.8, 1.4), 'points': 45, 'width': 30, 'height': 30,
+        'directionChangeProbability': 0.015, 'reverseMovementProbability': 0.0},
+    4: {'speedX': (0.8, 1.8), 'speedY': (0.9, 1.5), 'points': 60, 'width': 32, 'height': 32,
+        'directionChangeProbability': 0.020, 'reverseMovementProbability': 0.015},
+    5: {'speedX': (1.2, 2.2), 'speedY': (1.0, 1.6), 'points': 75, 'width': 28, 'height': 28,
+        'directionChangeProbability': 0.025, 'reverseMovementProbability': 0.0},
+    6: {'speedX': (1.0, 2.0), 'speedY': (1.1, 1.7), 'points': 90, 'width': 30, 'height': 30,
+        'directionChangeProbability': 0.030, 'reverseMovementProbability': 0.025},
+    7: {'speedX': (1.1, 2.1), 'speedY': (1.0, 1.6), 'points': 80, 'width': 32, 'height': 32,
+        'directionChangeProbability': 0.022, 'reverseMovementProbability': 0.018},
+    8: {'speedX': (1.3, 2.3), 'speedY': (1.2, 1.8), 'points': 100, 'width': 34, 'height': 34,
+        'directionChangeProbability': 0.035, 'reverseMovementProbability': 0.020},
+}
+CANVAS_WIDTH = 600
+CANVAS_HEIGHT = 800
+TICKS_PER_SECOND = 60
+PLAYER_RECT = (CANVAS_WIDTH / 2 - 9, CANVAS_HEIGHT - 55, 18, 18)  # x, y, width, height at spawn
+
+def _enemy_config(enemy_type: int) -> Dict[str, Any]:
+    return ENEMY_BASE_CONFIG.get(enemy_type, ENEMY_BASE_CONFIG[1])
+
+def _interval_ms(probability: float, eccentricity: float) -> float:
+    rate = probability * eccentricity
+    return 1000 / rate if rate > 0 else math.inf
+
+def _enemies_overlap(x1, y1, w1, h1, type1, x2, y2, w2, h2, type2) -> bool:
+    """Same rules as EnemyManager.checkEnhancedCollision (type 4 enemies are circles)"""
+    if type1 == 4 or type2 == 4:
+        dx = (x1 + w1 / 2) - (x2 + w2 / 2)
+        dy = (y1 + h1 / 2) - (y2 + h2 / 2)
+        r1 = w1 / 2 if type1 == 4 else min(w1, h1) / 2
+        r2 = w2 / 2 if type2 == 4 else min(w2, h2) / 2
+        return dx * dx + dy * dy < (r1 + r2) ** 2
+    return x1 < x2 + w2 and x1 + w1 > x2 and y1 < y2 + h2 and y1 + h1 > y2
+
+class _SimEnemy:
+    __slots__ = ('type', 'x', 'y', 'width', 'height', 'speedX', 'speedY', 'direction',
+                 'directionY', 'nextDirectionChangeTime', 'nextReverseTime')
+
+class EnemySimulation:
+    """Headless, seeded re-implementation of EnemyManager's spawn and movement rules.
+
+    Covers the spawn schedule, type sampling, direction changes, Y reversals, wall
+    bounces, wrapping and collision separation, one tick per 60 Hz frame. Bullets,
+    force fields and tractor beams are not modelled and the player stays at its
+    spawn point, so runs are reproducible per seed rather than identical to the
+    browser. Enemies keep their spawn slot, which is also their EnemyManager order.
+    """
+
+    def __init__(self, level: LevelConfig, seed: int = 0):
+        self.rng = random.Random(seed)
+        global_config = level.global_config
+        self.allowed_types = list(level.allowedEnemyTypes) or [1]
+        self.speed_multiplier = global_config.speedMultiplier or 1.0
+        self.eccentricity = global_config.eccentricityMultiplier or 1.0
+        self.separation = global_config.collisionSeparation
+        self.slots = max(0, int(global_config.maxEnemies))
+        self.schedule = sorted(self.rng.random() * global_config.spawnTimeWindow for _ in range(self.slots))
+        self.enemies: List[_SimEnemy] = []
+        self.tick = 0
+
+    def _create_enemy(self) -> _SimEnemy:
+        rng = self.rng
+        enemy = _SimEnemy()
+        enemy.type = self.allowed_types[int(rng.random() * len(self.allowed_types))]
+        config = _enemy_config(enemy.type)
+        enemy.width = config['width']
+        enemy.height = config['height']
+        enemy.x = rng.random() * (CANVAS_WIDTH - enemy.width)
+        enemy.y = rng.random() * -50 - 20
+        low, high = config['speedX']
+        enemy.speedX = (rng.random() * (high - low) + low) * self.speed_multiplier
+        low, high = config['speedY']
+        enemy.speedY = (rng.random() * (high - low) + low) * self.speed_multiplier
+        enemy.direction = 1 if rng.random() > 0.5 else -1
+        enemy.directionY = 1
+        enemy.nextDirectionChangeTime = None
+        enemy.nextReverseTime = None
+        return enemy
+
+    def step(self):
+        """Advance one frame: spawn due enemies, move them, then separate collisions"""
+        rng = self.rng
+        now = self.tick * 1000 / TICKS_PER_SECOND
+        seconds = now / 1000
+        while len(self.enemies) < self.slots and seconds >= self.schedule[len(self.enemies)]:
+            self.enemies.append(self._create_enemy())
+
+        player_cx = PLAYER_RECT[0] + PLAYER_RECT[2] / 2
+        player_cy = PLAYER_RECT[1] + PLAYER_RECT[3] / 2
+
+        for enemy in self.enemies:
+            config = _enemy_config(enemy.type)
+            direction_interval = _interval_ms(config['directionChangeProbability'], self.eccentricity)
+            reverse_interval = _interval_ms(config['reverseMovementProbability'], self.eccentricity)
+
+            if enemy.nextDirectionChangeTime is None:
+                enemy.nextDirectionChangeTime = now + rng.random() * direction_interval
+            if enemy.nextReverseTime is None and enemy.type in (4, 6, 7):
+                enemy.nextReverseTime = now + rng.random() * reverse_interval
+
+            if now >= enemy.nextDirectionChangeTime:
+                if rng.random() < 0.5:
+                    # Home in on the player
+                    dx = player_cx - (enemy.x + enemy.width / 2)
+                    dy = player_cy - (enemy.y + enemy.height / 2)
+                    enemy.direction = 1 if dx > 0 else -1
+                    enemy.directionY = 1 if dy > 0 or (dx == 0 and dy == 0) else -1
+                else:
+                    enemy.direction = 1 if rng.random() > 0.5 else -1
+                    if rng.random() < 0.3:
+                        enemy.directionY *= -1
+                enemy.nextDirectionChangeTime = now + direction_interval + (rng.random() - 0.5) * direction_interval * 0.5
+
+            if enemy.type in (4, 6, 7) and now >= enemy.nextReverseTime:
+                min_y = {4: CANVAS_HEIGHT * 0.1, 7: CANVAS_HEIGHT * 0.3}.get(enemy.type)
+                if min_y is None or enemy.y > min_y:
+                    enemy.directionY *= -1
+                    enemy.nextReverseTime = now + reverse_interval + (rng.random() - 0.5) * reverse_interval * 0.5
+
+            enemy.x += enemy.speedX * enemy.direction
+            enemy.y += enemy.speedY * enemy.directionY
+
+            if enemy.x <= 0 or enemy.x >= CANVAS_WIDTH - enemy.width:
+                enemy.direction *= -1
+                enemy.x = max(0, min(CANVAS_WIDTH - enemy.width, enemy.x))
+
+            if enemy.y > CANVAS_HEIGHT or enemy.y < -100:
+                enemy.y = rng.random() * -50 - 20 if enemy.y > CANVAS_HEIGHT else CANVAS_HEIGHT + 20
+                enemy.x = rng.random() * (CANVAS_WIDTH - enemy.width)
+                enemy.direction = 1 if rng.random() > 0.5 else -1
+                enemy.directionY = 1
+
+        self._separate_collisions()
+        self.tick += 1
+
+    def _separate_collisions(self):
+        # Sweep on x to find candidate pairs, then resolve them in the same (i, j)
+        # order as EnemyManager.handleEnemyCollision
+        enemies = self.enemies
+        order = sorted(range(len(enemies)), key=lambda i: enemies[i].x)
+        pairs = []
+        for pos, i in enumerate(order):
+            right = enemies[i].x + enemies[i].width
+            for j in order[pos + 1:]:
+                if enemies[j].x >= right:
+                    break
+                pairs.append((i, j) if i < j else (j, i))
+
+        for i, j in sorted(pairs):
+            a, b = enemies[i], enemies[j]
+            if not _enemies_overlap(a.x, a.y, a.width, a.height, a.type,
+                                    b.x, b.y, b.width, b.height, b.type):
+                continue
+            dx = (a.x + a.width / 2) - (b.x + b.width / 2)
+            dy = (a.y + a.height / 2) - (b.y + b.height / 2)
+            distance = math.hypot(dx, dy)
+            if distance > 0:
+                sep_x = dx / distance * self.separation
+                sep_y = dy / distance * self.separation
+                a.x += sep_x
+                a.y += sep_y
+                b.x -= sep_x
+                b.y -= sep_y
+                for enemy in (a, b):
+                    enemy.x = max(0, min(CANVAS_WIDTH - enemy.width, enemy.x))
+                    enemy.y = max(0, min(CANVAS_HEIGHT - enemy.height, enemy.y))
+                if self.rng.random() < 0.4:
+                    a.direction *= -1
+                    b.direction *= -1
+
+def expected_level_score(allowed_types: List[int], max_enemies: int, score_bonus: int) -> float:
+    """Expected score for destroying every scheduled enemy of a level.
+
+    EnemyManager picks each enemy's type uniformly from allowedEnemyTypes and
+    getEnemyPoints adds the level's scoreBonus to the type's base points.
+    """
+    mean_points, _ = _type_set_points(allowed_types)
+    return max_enemies * (mean_points + score_bonus) if allowed_types else 0.0
+
+def _type_set_points(allowed_types) -> Tuple[float, int]:
+    """Mean and highest base points over a level's allowed enemy types"""
+    if not allowed_types:
+        return 0.0, 0
+    points = [_enemy_config(t)['points'] for t in allowed_types]
+    return sum(points) / len(points), max(points)
+
+def level_score_columns(levels: Dict[int, LevelConfig], sorted_levels: List[int]) -> Tuple[array, array]:
+    """Expected and maximum score of every level, in sorted_levels order.
+
+    The maximum assumes every scheduled enemy rolls the most valuable allowed
+    type. Type-set points are looked up once per distinct allowedEnemyTypes, so
+    the pass over the level store is plain arithmetic on the columns.
+    """
+    type_points: Dict[Tuple, Tuple[float, int]] = {}
+    expected = array('d')
+    maximum = array('q')
+    for level_num in sorted_levels:
+        level = levels[level_num]
+        types = tuple(level.allowedEnemyTypes)
+        points = type_points.get(types)
+        if points is None:
+            points = type_points[types] = _type_set_points(types)
+        count = level.global_config.maxEnemies
+        bonus = level.global_config.scoreBonus
+        expected.append(count * (points[0] + bonus) if types else 0.0)
+        maximum.append(count * (points[1] + bonus) if types else 0)
+    return expected, maximum
+
+class _FenwickTree:
+    """Prefix sums over a fixed-length array with O(log n) point updates"""
+    
+    def __init__(self, values: array):
+        self.tree = array(values.typecode, [0]) + values  # 1-based
+        size = len(self.tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                self.tree[parent] += self.tree[i]
+    
+    def add(self, idx: int, delta):
+        i = idx + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+    
+    def prefix(self, idx: int):
+        """Sum of values[0..idx] inclusive"""
+        total = 0
+        i = idx + 1
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+class ScoreEconomy:
+    """Expected and maximum achievable score per level and cumulatively.
+
+    Built in one pass over the level store; the running totals live in Fenwick
+    trees so a field edit to one level is applied in O(log n). Adding, deleting or
+    reloading levels shifts the positions, so the editor rebuilds instead.
+    """
+    
+    def __init__(self, levels: Dict[int, LevelConfig], sorted_levels: List[int]):
+        self.levels = levels
+        self.sorted_levels = sorted_levels
+        self.expected, self.maximum = level_score_columns(levels, sorted_levels)
+        self._expected_sums = _FenwickTree(self.expected)
+        self._maximum_sums = _FenwickTree(self.maximum)
+    
+    def __len__(self) -> int:
+        return len(self.sorted_levels)
+    
+    def update(self, level_num: int):
+        """Recompute one level after a field edit"""
+        idx = bisect_left(self.sorted_levels, level_num)
+        (expected,), (maximum,) = level_score_columns(self.levels, [level_num])
+        self._expected_sums.add(idx, expected - self.expected[idx])
+        self._maximum_sums.add(idx, maximum - self.maximum[idx])
+        self.expected[idx] = expected
+        self.maximum[idx] = maximum
+    
+    def row(self, idx: int) -> Tuple[int, float, int, float, int]:
+        """(level, expected, maximum, cumulative expected, cumulative maximum)"""
+        return (self.sorted_levels[idx], self.expected[idx], self.maximum[idx],
+                self._expected_sums.prefix(idx), self._maximum_sums.prefix(idx))
+    
+    def rows(self, start_idx: int = 0) -> Iterator[Tuple[int, float, int, float, int]]:
+        cum_expected = self._expected_sums.prefix(start_idx - 1) if start_idx else 0.0
+        cum_maximum = self._maximum_sums.prefix(start_idx - 1) if start_idx else 0
+        for idx in range(start_idx, len(self.sorted_levels)):
+            cum_expected += self.expected[idx]
+            cum_maximum += self.maximum[idx]
+            yield self.sorted_levels[idx], self.expected[idx], self.maximum[idx], cum_expected, cum_maximum
+    
+    def totals(self) -> Tuple[float, int]:
+        last = len(self.sorted_levels) - 1
+        return self._expected_sums.prefix(last), self._maximum_sums.prefix(last)
+    
+    def cumulative_through(self, level_num: int) -> Tuple[float, int]:
+        """Cumulative expected and maximum score up to and including level_num"""
+        idx = bisect_right(self.sorted_levels, level_num) - 1
+        if idx < 0:
+            return 0.0, 0
+        return self._expected_sums.prefix(idx), self._maximum_sums.prefix(idx)
+
+DANGER_SIM_SECONDS = 60
+METRICS_POLL_MS = 100
+
+def simulate_danger(record: Tuple, seed: int = 0) -> float:
+    """Mean number of enemies in the bottom quarter of the screen (the player's zone)
+    over a seeded headless run of up to DANGER_SIM_SECONDS"""
+    level = record_to_level(record)
+    sim = EnemySimulation(level, seed)
+    seconds = min(max(0.0, level.global_config.spawnTimeWindow) + 10, DANGER_SIM_SECONDS)
+    ticks = int(seconds * TICKS_PER_SECOND)
+    zone_top = CANVAS_HEIGHT * 0.75
+    total = 0
+    for _ in range(ticks):
+        sim.step()
+        total += sum(1 for enemy in sim.enemies if enemy.y > zone_top)
+    return total / max(1, ticks)
+
+class LiveMetrics:
+    """Derived per-level metrics for the curses grid.
+
+    Spawn rate and expected score are cheap and computed inline. The simulated
+    danger estimate runs in a process pool, so the UI loop never competes for the
+    GIL, and is cached against the level record it was computed from. Asking for
+    a different record cancels the queued job for that level, and a result whose
+    record has gone stale is dropped, so rapid edits coalesce into one job.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) - 1)
+        self._pool = ProcessPoolExecutor(max_workers=max_workers)
+        self._jobs: Dict[int, Tuple[Tuple, Future]] = {}
+        self._danger: Dict[int, Tuple[Tuple, float]] = {}
+
+    def value(self, field: str, level_num: int, record: Tuple) -> str:
+        """Formatted metric for a grid cell; '...' while the danger job is running"""
+        if field == 'spawnRate':
+            spawn_window = record[3]
+            return f"{record[2] / spawn_window:.2f}" if spawn_window else "-"
+        if field == 'expectedScore':
+            return f"{expected_level_score(record[1], record[2], record[8]):.0f}"
+        cached = self._danger.get(level_num)
+        if cached is not None and cached[0] == record:
+            return f"{cached[1]:.2f}"
+        self._request(level_num, record)
+        return "..."
+
+    def _request(self, level_num: int, record: Tuple):
+        job = self._jobs.get(level_num)
+        if job is not None:
+            if job[0] == record:
+                return
+            job[1].cancel()
+        self._jobs[level_num] = (record, self._pool.submit(simulate_danger, record))
+
+    def retain(self, level_nums: set):
+        """Cancel queued jobs for levels that are no longer on screen"""
+        for level_num in [n for n in self._jobs if n not in level_nums]:
+            if self._jobs[level_num][1].cancel():
+                del self._jobs[level_num]
+
+    def collect(self) -> bool:
+        """Pick up finished jobs without blocking; True if any new value arrived"""
+        updated = False
+        for level_num in [n for n, (_, future) in self._jobs.items() if future.done()]:
+            record, future = self._jobs.pop(level_num)
+            if future.cancelled() or future.exception() is not None:
+                continue
+            self._danger[level_num] = (record, future.result())
+            updated = True
+        return updated
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+COLUMNAR_MAGIC = b'SDCOL001'
+
+class ColumnarWriter:
+    """Chunked column file: every chunk holds one zlib block per column.
+
+    Blocks are written as soon as a chunk is complete; a JSON footer records the
+    block offsets so readers can memory-map the file and inflate only the chunks
+    they touch. Numeric columns use array typecodes and are stored little-endian;
+    the 's' typecode marks a UTF-8 string column (lengths followed by the bytes).
+    """
+
+    def __init__(self, filename: str, columns: List[Tuple[str, str]], metadata: Optional[Dict[str, Any]] = None):
+        self.columns = columns
+        self.metadata = dict(metadata or {})
+        self.chunks: List[Dict[str, Any]] = []
+        self.filename = filename
+        self._file = open(filename, 'wb')
+        self._file.write(COLUMNAR_MAGIC)
+
+    def write_chunk(self, rows: int, data: Dict[str, Any]):
+        blocks = {}
+        for name, typecode in self.columns:
+            values = data[name]
+            if typecode == 's':
+                encoded = [value.encode('utf-8') for value in values]
+                lengths = array('I', map(len, encoded))
+                if sys.byteorder == 'big':
+                    lengths.byteswap()
+                payload = struct.pack('<I', len(encoded)) + lengths.tobytes() + b''.join(encoded)
+            else:
+                if sys.byteorder == 'big':
+                    values = array(typecode, values)
+                    values.byteswap()
+                payload = values.tobytes()
+            block = zlib.compress(payload, 6)
+            blocks[name] = [self._file.tell(), len(block)]
+            self._file.write(block)
+        self.chunks.append({'rows': rows, 'blocks': blocks})
+
+    def close(self):
+        footer = json.dumps({
+            'columns': self.columns,
+            'metadata': self.metadata,
+            'chunks': self.chunks
+        }).encode('utf-8')
+        offset = self._file.tell()
+        self._file.write(footer)
+        self._file.write(struct.pack('<Q', offset))
+        self._file.close()
+
+    def abort(self):
+        """Discard a partially written file instead of finalizing it"""
+        self._file.close()
+        try:
+            os.remove(self.filename)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        # A footer would make an interrupted write look complete
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+class ColumnarReader:
+    """Memory-mapped reader for files written by ColumnarWriter"""
+
+    def __init__(self, filename: str):
+        with open(filename, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < len(COLUMNAR_MAGIC) + 8 or self._map[:len(COLUMNAR_MAGIC)] != COLUMNAR_MAGIC:
+            self._map.close()
+            raise ValueError(f"{filename} is not a columnar level data file")
+        (offset,) = struct.unpack('<Q', self._map[-8:])
+        try:
+            footer = json.loads(self._map[offset:-8].decode('utf-8'))
+            self.columns: Dict[str, str] = dict(footer['columns'])
+            self.metadata: Dict[str, Any] = footer['metadata']
+            self.chunks: List[Dict[str, Any]] = footer['chunks']
+        except (ValueError, KeyError, TypeError) as e:
+            self._map.close()
+            raise ValueError(f"{filename} has a corrupt footer: {e}") from None
+
+    def read(self, chunk_idx: int, name: str):
+        """Inflate one column of one chunk"""
+        start, length = self.chunks[chunk_idx]['blocks'][name]
+        payload = zlib.decompress(self._map[start:start + length])
+        typecode = self.columns[name]
+        if typecode == 's':
+            (count,) = struct.unpack_from('<I', payload)
+            lengths = array('I')
+            lengths.frombytes(payload[4:4 + 4 * count])
+            if sys.byteorder == 'big':
+                lengths.byteswap()
+            strings = []
+            pos = 4 + 4 * count
+            for length in lengths:
+                strings.append(payload[pos:pos + length].decode('utf-8'))
+                pos += length
+            return strings
+        values = array(typecode)
+        values.frombytes(payload)
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return values
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# Positions are stored in 1/8 px as int16, delta-coded per slot against the previous
+# tick inside each chunk so slow-moving enemies compress to almost nothing
+TRACE_COLUMNS = [('x', 'h'), ('y', 'h'), ('type', 'B'), ('alive', 'B')]
+TRACE_POSITION_SCALE = 8
+TRACE_CHUNK_TICKS = 600
+_TRACE_POSITION_LIMIT = 16383  # keeps every delta within int16
+
+def _quantize(value: float) -> int:
+    return max(-_TRACE_POSITION_LIMIT, min(_TRACE_POSITION_LIMIT, round(value * TRACE_POSITION_SCALE)))
+
+def record_trace(level: LevelConfig, level_num: int, filename: str, seed: int = 0,
+                 seconds: Optional[float] = None, chunk_ticks: int = TRACE_CHUNK_TICKS) -> int:
+    """Run the headless simulation and write its per-tick trace; returns the tick count"""
+    if seconds is None:
+        seconds = level.global_config.spawnTimeWindow + 30
+    ticks = max(1, int(seconds * TICKS_PER_SECOND))
+    sim = EnemySimulation(level, seed)
+    slots = sim.slots
+    metadata = {
+        'level': level_num, 'name': level.name, 'seed': seed, 'slots': slots,
+        'ticks': ticks, 'chunk_ticks': chunk_ticks, 'ticks_per_second': TICKS_PER_SECOND,
+        'canvas': [CANVAS_WIDTH, CANVAS_HEIGHT], 'scale': TRACE_POSITION_SCALE,
+        'level_config': asdict(level)
+    }
+
+    with ColumnarWriter(filename, TRACE_COLUMNS, metadata) as writer:
+        for chunk_start in range(0, ticks, chunk_ticks):
+            rows = min(chunk_ticks, ticks - chunk_start)
+            xs = array('h')
+            ys = array('h')
+            types = array('B')
+            alive = array('B')
+            prev_x = [0] * slots
+            prev_y = [0] * slots
+            for _ in range(rows):
+                sim.step()
+                enemies = sim.enemies
+                for slot in range(slots):
+                    if slot < len(enemies):
+                        enemy = enemies[slot]
+                        qx, qy = _quantize(enemy.x), _quantize(enemy.y)
+                        types.append(enemy.type)
+                        alive.append(1)
+                    else:
+                        qx = qy = 0
+                        types.append(0)
+                        alive.append(0)
+                    xs.append(qx - prev_x[slot])
+                    ys.append(qy - prev_y[slot])
+                    prev_x[slot] = qx
+                    prev_y[slot] = qy
+            writer.write_chunk(rows, {'x': xs, 'y': ys, 'type': types, 'alive': alive})
+
+    return ticks
+
+class TraceReader:
+    """Random access to a recorded trace; only the chunks covering a request are inflated"""
+
+    def __init__(self, filename: str):
+        self._reader = ColumnarReader(filename)
+        self.metadata = self._reader.metadata
+        if 'slots' not in self.metadata:
+            self._reader.close()
+            raise ValueError(f"{filename} is not an enemy trace")
+        self.slots: int = self.metadata['slots']
+        self.ticks: int = self.metadata['ticks']
+        self.chunk_ticks: int = self.metadata['chunk_ticks']
+        chunk_rows = [chunk['rows'] for chunk in self._reader.chunks]
+        if sum(chunk_rows) < self.ticks or any(rows != self.chunk_ticks for rows in chunk_rows[:-1]):
+            self._reader.close()
+            raise ValueError(f"{filename} is an incomplete trace ({sum(chunk_rows)} of {self.ticks} ticks)")
+        self._cached_chunk: Optional[int] = None
+        self._cached_columns = None
+
+    def close(self):
+        self._reader.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _chunk(self, chunk_idx: int):
+        """Absolute x, y (in px units of 1/scale), type and alive columns for one chunk"""
+        if chunk_idx != self._cached_chunk:
+            xs = self._reader.read(chunk_idx, 'x')
+            ys = self._reader.read(chunk_idx, 'y')
+            for slot in range(self.slots):
+                xs[slot::self.slots] = array('h', accumulate(xs[slot::self.slots]))
+                ys[slot::self.slots] = array('h', accumulate(ys[slot::self.slots]))
+            self._cached_columns = (xs, ys, self._reader.read(chunk_idx, 'type'),
+                                    self._reader.read(chunk_idx, 'alive'))
+            self._cached_chunk = chunk_idx
+        return self._cached_columns
+
+    def frame(self, tick: int) -> List[Tuple[int, int, float, float]]:
+        """Alive enemies at a tick as (slot, type, x, y)"""
+        tick = max(0, min(self.ticks - 1, tick))
+        xs, ys, types, alive = self._chunk(tick // self.chunk_ticks)
+        base = (tick % self.chunk_ticks) * self.slots
+        scale = TRACE_POSITION_SCALE
+        return [(slot, types[base + slot], xs[base + slot] / scale, ys[base + slot] / scale)
+                for slot in range(self.slots) if alive[base + slot]]
+
+    def heatmap(self, cols: int, rows: int, start_tick: int = 0, end_tick: Optional[int] = None) -> List[List[int]]:
+        """Count enemy presence per on-screen cell (by sprite centre) over a tick range"""
+        end_tick = self.ticks if end_tick is None else min(end_tick, self.ticks)
+        grid = [[0] * cols for _ in range(rows)]
+        x_scale = cols / (CANVAS_WIDTH * TRACE_POSITION_SCALE)
+        y_scale = rows / (CANVAS_HEIGHT * TRACE_POSITION_SCALE)
+        # Half sprite size per type, in stored position units
+        centre_offsets: Dict[int, Tuple[float, float]] = {}
+        tick = max(0, start_tick)
+        while tick < end_tick:
+            chunk_idx = tick // self.chunk_ticks
+            chunk_end = min(end_tick, (chunk_idx + 1) * self.chunk_ticks)
+            xs, ys, types, alive = self._chunk(chunk_idx)
+            lo = (tick - chunk_idx * self.chunk_ticks) * self.slots
+            hi = (chunk_end - chunk_idx * self.chunk_ticks) * self.slots
+            for i in range(lo, hi):
+                if alive[i]:
+                    offset = centre_offsets.get(types[i])
+                    if offset is None:
+                        config = _enemy_config(types[i])
+                        offset = centre_offsets[types[i]] = (config['width'] * TRACE_POSITION_SCALE / 2,
+                                                             config['height'] * TRACE_POSITION_SCALE / 2)
+                    row = int((ys[i] + offset[1]) * y_scale)
+                    if 0 <= row < rows:
+                        grid[row][min(cols - 1, max(0, int((xs[i] + offset[0]) * x_scale)))] += 1
+            tick = chunk_end
+        return grid
+
+    def summary(self) -> Dict[str, Any]:
+        """Whole-trace statistics, including how long the player's spawn point was blocked"""
+        px, py, pw, ph = PLAYER_RECT
+        peak_alive = 0
+        alive_total = 0
+        blocked_ticks = 0
+        type_counts: Dict[int, int] = {}
+        scale = TRACE_POSITION_SCALE
+        for chunk_idx, chunk in enumerate(self._reader.chunks):
+            xs, ys, types, alive = self._chunk(chunk_idx)
+            for row in range(chunk['rows']):
+                base = row * self.slots
+                count = 0
+                blocked = False
+                for i in range(base, base + self.slots):
+                    if alive[i]:
+                        count += 1
+                        if not blocked:
+                            config = _enemy_config(types[i])
+                            blocked = _enemies_overlap(xs[i] / scale, ys[i] / scale, config['width'],
+                                                       config['height'], types[i], px, py, pw, ph, 0)
+                peak_alive = max(peak_alive, count)
+                alive_total += count
+                blocked_ticks += blocked
+        last_types = self._chunk(len(self._reader.chunks) - 1)[2][-self.slots:] if self._reader.chunks else []
+        for enemy_type in last_types:
+            if enemy_type:
+                type_counts[enemy_type] = type_counts.get(enemy_type, 0) + 1
+        return {
+            'ticks': self.ticks,
+            'seconds': self.ticks / TICKS_PER_SECOND,
+            'peak_alive': peak_alive,
+            'mean_alive': alive_total / self.ticks if self.ticks else 0.0,
+            'player_blocked_seconds': blocked_ticks / TICKS_PER_SECOND,
+            'type_counts': dict(sorted(type_counts.items()))
+        }
+
+HEATMAP_SHADES = ' .:-=+*#%@'
+
+def render_heatmap(grid: List[List[int]]) -> List[str]:
+    peak = max((max(row) for row in grid), default=0) or 1
+    top = len(HEATMAP_SHADES) - 1
+    return [''.join(HEATMAP_SHADES[(count * top + peak - 1) // peak] for count in row) for row in grid]
+
+# Flat sheet layout shared by the CSV and columnar level exports
+EXPORT_COLUMNS = ['level', 'name', 'allowedEnemyTypes'] + GLOBAL_FIELDS
+EXPORT_BATCH_SIZE = 10000
+def _finite_float(value) -> float:
+    """float() that rejects nan/inf, which the JavaScript config cannot hold"""
+    result = float(value)
+    if not math.isfinite(result):
+        raise ValueError(f"non-finite value {value!r}")
+    return result
+
+_GLOBAL_PARSERS = [int if f.type is int else _finite_float for f in fields(GlobalConfig)]
+_GLOBAL_DEFAULTS = {f.name: f.default for f in fields(GlobalConfig) if f.default is not MISSING}
+_EXPORT_TYPECODES = [('level', 'q'), ('name', 's'), ('allowedEnemyTypes', 's')] + [
+    (f.name, 'q' if f.type is int else 'd') for f in fields(GlobalConfig)]
+
+@contextmanager
+def _gc_paused():
+    """Suspend the cyclic collector while building many acyclic objects in bulk"""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+def _batched(iterable, size: int):
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def is_columnar_file(filename: str) -> bool:
+    with open(filename, 'rb') as f:
+        return f.read(len(COLUMNAR_MAGIC)) == COLUMNAR_MAGIC
+
+def export_levels(levels: Dict[int, LevelConfig], filename: str, batch_size: int = EXPORT_BATCH_SIZE) -> int:
+    """Stream levels to a CSV (.csv) or columnar file in batches; returns the row count"""
+    count = 0
+    sorted_nums = sorted(levels.keys())
+
+    if filename.lower().endswith('.csv'):
+        with open(filename, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_COLUMNS)
+            for batch in _batched(sorted_nums, batch_size):
+                rows = []
+                for level_num in batch:
+                    level = levels[level_num]
+                    rows.append((level_num, level.name, ','.join(map(str, level.allowedEnemyTypes)))
+                                + _global_values(level.global_config))
+                writer.writerows(rows)
+                count += len(rows)
+        return count
+
+    with ColumnarWriter(filename, _EXPORT_TYPECODES, {'format': 'levels'}) as writer:
+        for batch in _batched(sorted_nums, batch_size):
+            batch_levels = [levels[level_num] for level_num in batch]
+            data = {
+                'level': array('q', batch),
+                'name': [level.name for level in batch_levels],
+                'allowedEnemyTypes': [','.join(map(str, level.allowedEnemyTypes)) for level in batch_levels],
+            }
+            for name, typecode in _EXPORT_TYPECODES[3:]:
+                data[name] = array(typecode, [getattr(level.global_config, name) for level in batch_levels])
+            writer.write_chunk(len(batch), data)
+            count += len(batch)
+    return count
+
+def iter_level_rows(filename: str) -> Iterator[Tuple[int, Optional[List[Any]], Optional[str]]]:
+    """Yield (row number, values in EXPORT_COLUMNS order, error) from a CSV or columnar export.
+
+    Both formats are read incrementally (CSV line by line, columnar one chunk at a
+    time). Raises ValueError if the file layout itself is unusable or a columnar
+    chunk is corrupt; individual rows are yielded unchecked so the caller can report
+    and skip bad ones. A CSV line the csv module cannot split comes back with values
+    None and the reason in error; error is None for every other row.
+    """
+    if is_columnar_file(filename):
+        with ColumnarReader(filename) as reader:
+            if reader.metadata.get('format') != 'levels':
+                raise ValueError(f"{filename} is not a level export")
+            missing = [name for name in EXPORT_COLUMNS if name not in reader.columns and name not in _GLOBAL_DEFAULTS]
+            if missing:
+                raise ValueError(f"{filename} is missing columns: {', '.join(missing)}")
+            row_num = 0
+            for chunk_idx, chunk in enumerate(reader.chunks):
+                try:
+                    columns = [reader.read(chunk_idx, name) if name in reader.columns
+                               else [_GLOBAL_DEFAULTS[name]] * chunk['rows'] for name in EXPORT_COLUMNS]
+                except (zlib.error, struct.error, ValueError, KeyError, IndexError, TypeError) as e:
+                    raise ValueError(f"chunk {chunk_idx} is corrupt ({e})") from None
+                for values in zip(*columns):
+                    row_num += 1
+                    yield row_num, list(values), None
+        return
+
+    # utf-8-sig drops the byte order mark spreadsheet programs put on "CSV UTF-8" files
+    with open(filename, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"{filename} is empty")
+        positions = {name.strip(): idx for idx, name in enumerate(header)}
+        missing = [name for name in EXPORT_COLUMNS if name not in positions and name not in _GLOBAL_DEFAULTS]
+        if missing:
+            raise ValueError(f"{filename} is missing columns: {', '.join(missing)}")
+        layout = [(positions.get(name), _GLOBAL_DEFAULTS.get(name)) for name in EXPORT_COLUMNS]
+
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                # The reader resumes at the next line, so only this row is lost
+                yield reader.line_num, None, f"unreadable CSV line: {e}"
+                continue
+            values = [row[idx] if idx is not None and idx < len(row) else default
+                      for idx, default in layout]
+            yield reader.line_num, values, None
+
+def level_from_row(values: List[Any]) -> Tuple[int, LevelConfig]:
+    """Convert EXPORT_COLUMNS-ordered values into a level, raising ValueError on bad data"""
+    if None in values:
+        missing = [name for name, value in zip(EXPORT_COLUMNS, values) if value is None]
+        raise ValueError(f"missing {', '.join(missing)}")
+    try:
+        level_num = int(values[0])
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid level '{values[0]}'") from None
+    try:
+        enemy_types = [int(x) for x in str(values[2]).split(',') if x.strip()]
+    except ValueError:
+        raise ValueError(f"invalid allowedEnemyTypes '{values[2]}'") from None
+    try:
+        global_config = GlobalConfig(*[parse(value) for parse, value in zip(_GLOBAL_PARSERS, values[3:])])
+    except (TypeError, ValueError):
+        # Slow path only for reporting which field was bad
+        for field, parse, value in zip(GLOBAL_FIELDS, _GLOBAL_PARSERS, values[3:]):
+            try:
+                parse(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"invalid {field} '{value}'") from None
+        raise
+    return level_num, LevelConfig(
+        name=str(values[1]),
+        allowedEnemyTypes=enemy_types,
+        global_config=global_config
+    )
+
+# Score economy export layout, shared by CSV and columnar output
+SCORE_EXPORT_COLUMNS = [('level', 'q'), ('name', 's'), ('maxEnemies', 'q'), ('scoreBonus', 'q'),
+                        ('expectedScore', 'd'), ('maxScore', 'q'),
+                        ('cumulativeExpected', 'd'), ('cumulativeMax', 'q')]
+SCORE_DISPLAY_LIMIT = 999999  # the HUD pads scores to six digits
+
+def export_scores(economy: 'ScoreEconomy', filename: str, batch_size: int = EXPORT_BATCH_SIZE) -> int:
+    """Stream the score economy to a CSV (.csv) or columnar file; returns the row count"""
+    count = 0
+    names = [name for name, _ in SCORE_EXPORT_COLUMNS]
+
+    def batches():
+        for batch in _batched(economy.rows(), batch_size):
+            yield [(level_num, economy.levels[level_num].name,
+                    economy.levels[level_num].global_config.maxEnemies,
+                    economy.levels[level_num].global_config.scoreBonus,
+                    round(expected, 2), maximum, round(cum_expected, 2), cum_maximum)
+                   for level_num, expected, maximum, cum_expected, cum_maximum in batch]
+
+    if filename.lower().endswith('.csv'):
+        with open(filename, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(names)
+            for rows in batches():
+                writer.writerows(rows)
+                count += len(rows)
+        return count
+
+    with ColumnarWriter(filename, SCORE_EXPORT_COLUMNS, {'format': 'scores'}) as writer:
+        for rows in batches():
+            columns = list(zip(*rows))
+            writer.write_chunk(len(rows), {
+                name: list(column) if typecode == 's' else array(typecode, column)
+                for (name, typecode), column in zip(SCORE_EXPORT_COLUMNS, columns)
+            })
+            count += len(rows)
+    return count
+
+def read_high_scores(filename: str) -> List[Dict[str, Any]]:
+    """Load leaderboard entries saved from the game's 'stellarDefenseHighScores' storage key"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    if isinstance(entries, str):
+        # localStorage values are JSON strings themselves
+        entries = json.loads(entries)
+    if not isinstance(entries, list) or not all(
+            isinstance(entry, dict) and 'score' in entry and 'level' in entry for entry in entries):
+        raise ValueError(f"{filename} is not a high score list")
+    return entries
+
+def check_high_score(economy: 'ScoreEconomy', score: int, level_num: int) -> Optional[str]:
+    """Explain why a leaderboard entry is impossible for the campaign, or None if it is plausible"""
+    _, maximum = economy.cumulative_through(level_num)
+    if score > maximum:
+        return f"score {score} exceeds the {maximum} available through level {level_num}"
+    return None
+
+# Fixed-width console table used by 'view' (header, width, alignment)
+VIEW_COLUMNS = [
+    ("Level", 6, '>'), ("Name", 14, '<'), ("Enemy Types", 16, '<'), ("Max Enemies", 11, '>'),
+    ("Spawn Time", 10, '>'), ("Collision Sep", 13, '>'), ("Wrap Buffer", 11, '>'),
+    ("Speed Mult", 10, '>'), ("Eccentricity", 12, '>'), ("Score Bonus", 11, '>'),
+]
+_VIEW_ROW = ' | '.join(f'{{:{align}{width}.{width}}}' for _, width, align in VIEW_COLUMNS)
+VIEW_HEADER = _VIEW_ROW.format(*(name for name, _, _ in VIEW_COLUMNS))
+VIEW_SEPARATOR = '-+-'.join('-' * width for _, width, _ in VIEW_COLUMNS)
+
+def format_level_row(level_num: int, level: LevelConfig) -> str:
+    config = level.global_config
+    return _VIEW_ROW.format(
+        str(level_num),
+        level.name,
+        ','.join(map(str, level.allowedEnemyTypes)),
+        str(config.maxEnemies),
+        f"{config.spawnTimeWindow:.1f}",
+        f"{config.collisionSeparation:.1f}",
+        str(config.wrapBuffer),
+        f"{config.speedMultiplier:.2f}",
+        f"{config.eccentricityMultiplier:.2f}",
+        str(config.scoreBonus)
+    )
+
+SCORE_COLUMNS = [
+    ("Level", 6, '>'), ("Name", 14, '<'), ("Enemy Types", 16, '<'), ("Max Enemies", 11, '>'),
+    ("Score Bonus", 11, '>'), ("Expected", 9, '>'), ("Maximum", 8, '>'),
+    ("Cum Expected", 12, '>'), ("Cum Maximum", 11, '>'),
+]
+_SCORE_ROW = ' | '.join(f'{{:{align}{width}.{width}}}' for _, width, align in SCORE_COLUMNS)
+SCORE_HEADER = _SCORE_ROW.format(*(name for name, _, _ in SCORE_COLUMNS))
+SCORE_SEPARATOR = '-+-'.join('-' * width for _, width, _ in SCORE_COLUMNS)
+
+def format_score_row(level: LevelConfig, row: Tuple[int, float, int, float, int]) -> str:
+    level_num, expected, maximum, cum_expected, cum_maximum = row
+    return _SCORE_ROW.format(
+        str(level_num),
+        level.name,
+        ','.join(map(str, level.allowedEnemyTypes)),
+        str(level.global_config.maxEnemies),
+        str(level.global_config.scoreBonus),
+        f"{expected:.1f}",
+        str(maximum),
+        f"{cum_expected:.1f}",
+        str(cum_maximum)
+    )
+
+def _level_ranges(sorted_levels: List[int]) -> Iterator[str]:
+    """Yield "a-b" strings for runs of consecutive level numbers"""
+    run_start = prev = None
+    for level_num in sorted_levels:
+        if prev is not None and level_num == prev + 1:
+            prev = level_num
+            continue
+        if run_start is not None:
+            yield str(run_start) if run_start == prev else f"{run_start}-{prev}"
+        run_start = prev = level_num
+    if run_start is not None:
+        yield str(run_start) if run_start == prev else f"{run_start}-{prev}"
+
+# Terminal escape sequences mapped to the pager key they stand for
+_PAGER_KEYS = {
+    '\x1b[B': ' ', '\x1bOB': ' ', '\x1b[6~': ' ',                     # Down, PgDn: next
+    '\x1b[A': 'b', '\x1bOA': 'b', '\x1b[5~': 'b',                     # Up, PgUp: back
+    '\x1b[H': 'g', '\x1bOH': 'g', '\x1b[1~': 'g', '\x1b[7~': 'g',     # Home: first
+    '\x1b[F': 'G', '\x1bOF': 'G', '\x1b[4~': 'G', '\x1b[8~': 'G',     # End: last
+}
+
+def _prompt_key(prompt: str) -> str:
+    """Show a pager prompt and read a single keypress without waiting for Enter.
+
+    Reads straight from the descriptor so a whole escape sequence is consumed at
+    once (nothing is left behind for the next prompt); arrow and paging keys come
+    back as their pager letter, any other sequence as itself.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    fd = sys.stdin.fileno()
+    old_attrs = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        data = os.read(fd, 32).decode('utf-8', 'replace')
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+    sys.stdout.write('\r\x1b[K')
+    if len(data) > 1 and data.startswith('\x1b'):
+        return _PAGER_KEYS.get(data, data)
+    return data[:1]
+
+# Short field names accepted by 'edit' in addition to the LEVEL_FIELDS names
+FIELD_ALIASES = {
+    'enemyTypes': 'allowedEnemyTypes',
+    'spawnTime': 'spawnTimeWindow',
+    'collisionSep': 'collisionSeparation',
+    'speedMult': 'speedMultiplier',
+    'eccentricity': 'eccentricityMultiplier',
+}
+_FIELD_PARSERS = dict(zip(GLOBAL_FIELDS, _GLOBAL_PARSERS))
+
+def parse_field_value(field: str, value: str) -> Tuple[str, Any]:
+    """Resolve a field name or alias and parse its value; KeyError for unknown fields"""
+    canonical = FIELD_ALIASES.get(field, field)
+    if canonical == 'name':
+        return canonical, value
+    if canonical == 'allowedEnemyTypes':
+        # Parse comma-separated list of integers
+        return canonical, [int(x.strip()) for x in value.split(',')]
+    return canonical, _FIELD_PARSERS[canonical](value)
+
+def set_level_field(level: LevelConfig, field: str, value: Any):
+    if field in ('name', 'allowedEnemyTypes'):
+        setattr(level, field, value)
+    else:
+        setattr(level.global_config, field, value)
+
+@dataclass
+class Campaign:
+    """One config file in a workspace.
+
+    Levels start out as shared, interned records and are only turned into
+    LevelConfig objects (owned by this campaign) the first time it is activated.
+    """
+    filename: str
+    records: Dict[int, Tuple]
+    levels: Optional[Dict[int, LevelConfig]] = None
+    sorted_levels: Optional[List[int]] = None
+    modified: bool = False
+
+    def get_record(self, level_num: int) -> Optional[Tuple]:
+        if self.levels is not None:
+            level = self.levels.get(level_num)
+            return level_to_record(level) if level is not None else None
+        return self.records.get(level_num)
+
+    def to_levels(self) -> Dict[int, LevelConfig]:
+        if self.levels is not None:
+            return self.levels
+        return {level_num: record_to_level(record) for level_num, record in self.records.items()}
+
+def _load_campaign_records(filename: str) -> Tuple[Optional[Dict[int, Tuple]], Optional[str]]:
+    """Worker for parallel config loading; errors are returned, not raised"""
+    try:
+        # Records are acyclic, so skip collector passes while building many of them
+        with _gc_paused():
+            return read_level_records(filename), None
+    except FileNotFoundError:
+        return None, f"File {filename} not found"
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        return None, f"Error reading file {filename}: {e}"
+
 class LevelEditor:
     def __init__(self):
         self.levels: Dict[int, LevelConfig] = {}
+        self.sorted_levels: List[int] = []  # level numbers in order, kept in step with self.levels
         self.current_file: Optional[str] = None
         self.modified = False
+        # Workspace of several config files; the active one is mirrored in self.levels
+        self.workspace: Dict[str, Campaign] = {}
+        self.active_campaign: Optional[str] = None
+        self._shared_records: Dict[Tuple, Tuple] = {}
+        self._shared_type_lists: Dict[Tuple, Tuple] = {}
+        # Background metrics and the in-progress cell edit they preview (curses mode only)
+        self.live_metrics: Optional[LiveMetrics] = None
+        self._preview: Optional[Tuple[int, Tuple]] = None
+        # Built on first use; field edits update it, level set changes drop it
+        self.score_economy: Optional[ScoreEconomy] = None
         
+    def _index_levels(self):
+        """Rebuild the sorted level index after self.levels was replaced wholesale"""
+        self.sorted_levels = sorted(self.levels.keys())
+        self.score_economy = None
+    
+    def _index_add(self, level_num: int):
+        insort(self.sorted_levels, level_num)
+        self.score_economy = None
+    
+    def _index_remove(self, level_num: int):
+        del self.sorted_levels[bisect_left(self.sorted_levels, level_num)]
+        self.score_economy = None
+    
+    def _level_edited(self, level_num: int):
+        """Keep derived per-level state in step after a field edit"""
+        if self.score_economy is not None:
+            self.score_economy.update(level_num)
+    
+    def scores(self) -> ScoreEconomy:
+        if self.score_economy is None:
+            self.score_economy = ScoreEconomy(self.levels, self.sorted_levels)
+        return self.score_economy
+    
     def parse_js_file(self, filename: str) -> bool:
         """Parse the JavaScript level_config.js file"""
+        self._stash_campaign()
+        campaign_name = self._find_campaign(filename)
+        if campaign_name is not None and campaign_name != self.active_campaign \
+                and self.workspace[campaign_name].modified:
+            print(f"Error: {filename} is open in the workspace as '{campaign_name}' with unsaved changes; "
+                  f"use 'ws use {campaign_name}' or 'ws save' first")
+            return False
+        
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract the levelConfigs object using regex
-            pattern = r'const\s+levelConfigs\s*=\s*(\{.*?\});'
-            match = re.search(pattern, content, re.DOTALL)
-            
-            if not match:
-                print(f"Error: Could not find levelConfigs object in {filename}")
-                return False
-            
-            js_object = match.group(1)
-            
-            # Convert JavaScript object notation to JSON
-            # Handle comments (remove them) - do this first
-            js_object = re.sub(r'//.*?$', '', js_object, flags=re.MULTILINE)
-            # Replace single quotes with double quotes
-            js_object = re.sub(r"'([^']*)'", r'"\1"', js_object)
-            # Handle property names without quotes
-            js_object = re.sub(r'(\w+):', r'"\1":', js_object)
-            # Fix decimal numbers starting with dot (e.g., .6 -> 0.6)
-            js_object = re.sub(r'(\s|:)\.(\d+)', r'\g<1>0.\2', js_object)
-            # Remove trailing commas before closing braces/brackets
-            js_object = re.sub(r',(\s*[}\]])', r'\1', js_object)
-            
-            try:
-                data = json.loads(js_object)
-            except json.JSONDecodeError as e:
-                print(f"Error parsing JavaScript object: {e}")
-                return False
-            
-            # Convert to our data structure
-            self.levels.clear()
-            for level_num_str, level_data in data.items():
-                level_num = int(level_num_str)
-                global_data = level_data['global']
-                
-                global_config = GlobalConfig(
-                    maxEnemies=global_data['maxEnemies'],
-                    spawnTimeWindow=global_data['spawnTimeWindow'],
-                    collisionSeparation=global_data['collisionSeparation'],
-                    wrapBuffer=global_data['wrapBuffer'],
-                    speedMultiplier=global_data['speedMultiplier'],
-                    eccentricityMultiplier=global_data['eccentricityMultiplier'],
-                    scoreBonus=global_data.get('scoreBonus', 0)
-                )
-                
-                level_config = LevelConfig(
-                    name=level_data['name'],
-                    allowedEnemyTypes=level_data['allowedEnemyTypes'],
-                    global_config=global_config
-                )
-                
-                self.levels[level_num] = level_config
-            
-            self.current_file = filename
-            self.modified = False
-            print(f"Successfully loaded {len(self.levels)} levels from {filename}")
-            return True
-            
+            levels = read_level_configs(filename)
         except FileNotFoundError:
             print(f"Error: File {filename} not found")
             return False
+        except ValueError as e:
+            print(f"Error: {e}")
+            return False
         except Exception as e:
             print(f"Error reading file {filename}: {e}")
             return False
+        
+        self.levels = levels
+        self._index_levels()
+        self.current_file = filename
+        self.modified = False
+        # Detach from the active campaign so the new file never lands in its slot;
+        # a file that is itself open in the workspace becomes the active campaign
+        self.active_campaign = campaign_name
+        if campaign_name is not None:
+            self.workspace[campaign_name].records = {}
+            self._stash_campaign()
+        print(f"Successfully loaded {len(self.levels)} levels from {filename}")
+        return True
     
     def save_js_file(self, filename: Optional[str] = None) -> bool:
         """Save the configuration back to JavaScript format"""
@@ -115,57 +1396,7 @@ class LevelEditor:
             return False
         
         try:
-            # Generate JavaScript content
-            js_content = '''/**
- * Level configuration object that defines the behavior and parameters for each game level.
- * Each level has a unique configuration for different enemy types and global settings.
- * 
- * Structure:
- * {
- *   [levelNumber]: {
- *     name: string,              // Display name of the level (e.g. "1 Alpha")
- *     allowedEnemyTypes: number[], // Array of allowed enemy types (1, 2, 3)
- *     global: {                  // Global level settings
- *       maxEnemies: number,      // Maximum number of enemies allowed in the level
- *       spawnTimeWindow: number, // Time window in seconds to spawn all enemies
- *       collisionSeparation: number, // Force applied to separate colliding enemies
- *       wrapBuffer: number,      // Distance from top before enemies wrap around
- *       speedMultiplier: number, // Multiplier applied to all enemy speeds
- *       eccentricityMultiplier: number // Multiplier for enemy direction change probability
- *     }
- *   }
- * }
- */
-const levelConfigs = {
-'''
-            
-            for level_num in sorted(self.levels.keys()):
-                level = self.levels[level_num]
-                js_content += f'    {level_num}: {{\n'
-                js_content += f'        name: "{level.name}",\n'
-                js_content += f'        allowedEnemyTypes: {level.allowedEnemyTypes},\n'
-                js_content += f'        global: {{\n'
-                js_content += f'            maxEnemies: {level.global_config.maxEnemies},\n'
-                js_content += f'            spawnTimeWindow: {level.global_config.spawnTimeWindow},\n'
-                js_content += f'            collisionSeparation: {level.global_config.collisionSeparation},\n'
-                js_content += f'            wrapBuffer: {level.global_config.wrapBuffer},\n'
-                js_content += f'            speedMultiplier: {level.global_config.speedMultiplier},\n'
-                js_content += f'            eccentricityMultiplier: {level.global_config.eccentricityMultiplier}'
-                
-                if level.global_config.scoreBonus > 0:
-                    js_content += f',\n            scoreBonus: {level.global_config.scoreBonus}'
-                
-                js_content += f'\n        }}\n'
-                js_content += f'    }}'
-                
-                if level_num != max(self.levels.keys()):
-                    js_content += ','
-                js_content += '\n'
-            
-            js_content += '}; \n'
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(js_content)
+            write_level_configs(filename, self.levels)
             
             self.modified = False
             print(f"Successfully saved {len(self.levels)} levels to {filename}")
@@ -175,54 +1406,76 @@ const levelConfigs = {
             print(f"Error saving file {filename}: {e}")
             return False
     
-    def display_spreadsheet(self, start_level: int = 1, max_rows: int = 20):
-        """Display levels in a spreadsheet-like format"""
+    def display_spreadsheet(self, start_level: int = 1, max_rows: Optional[int] = None):
+        """Display levels in a spreadsheet-like format, paging through them on a terminal"""
         if not self.levels:
             print("No levels loaded. Use 'load <filename>' to load a configuration file.")
             return
         
-        # Get range of levels to display
-        sorted_levels = sorted(self.levels.keys())
-        if start_level not in sorted_levels:
-            start_level = sorted_levels[0]
-        
-        start_idx = sorted_levels.index(start_level)
-        end_idx = min(start_idx + max_rows, len(sorted_levels))
-        display_levels = sorted_levels[start_idx:end_idx]
+        def render(start_idx, end_idx):
+            display_levels = self.sorted_levels[start_idx:end_idx]
+            lines = [f"\nLevel Configuration (Showing levels {display_levels[0]}-{display_levels[-1]} of {len(self.sorted_levels)} total)",
+                     VIEW_HEADER, VIEW_SEPARATOR]
+            lines.extend(format_level_row(level_num, self.levels[level_num]) for level_num in display_levels)
+            return lines
         
-        # Prepare table data
-        headers = [
-            "Level", "Name", "Enemy Types", "Max Enemies", "Spawn Time", 
-            "Collision Sep", "Wrap Buffer", "Speed Mult", "Eccentricity", "Score Bonus"
-        ]
+        self._page_levels(start_level, max_rows, render, 'view')
+    
+    def _page_levels(self, start_level: int, max_rows: Optional[int], render, command: str):
+        """Print render(start_idx, end_idx) a page at a time, starting at start_level"""
+        # Start at the first level at or after start_level
+        total = len(self.sorted_levels)
+        start_idx = min(bisect_left(self.sorted_levels, start_level), total - 1)
+        interactive = sys.stdin.isatty() and sys.stdout.isatty()
+        if max_rows is None:
+            max_rows = max(5, shutil.get_terminal_size().lines - 6) if interactive else 20
         
-        rows = []
-        for level_num in display_levels:
-            level = self.levels[level_num]
-            gc = level.global_config
+        while True:
+            end_idx = min(start_idx + max_rows, total)
+            print('\n'.join(render(start_idx, end_idx)))
             
-            enemy_types_str = ','.join(map(str, level.allowedEnemyTypes))
+            if not interactive:
+                if end_idx < total:
+                    print(f"\n... and {total - end_idx} more levels. Use '{command} {self.sorted_levels[end_idx]}' to see more.")
+                return
             
-            row = [
-                level_num,
-                level.name,
-                enemy_types_str,
-                gc.maxEnemies,
-                f"{gc.spawnTimeWindow:.1f}",
-                f"{gc.collisionSeparation:.1f}",
-                gc.wrapBuffer,
-                f"{gc.speedMultiplier:.2f}",
-                f"{gc.eccentricityMultiplier:.2f}",
-                gc.scoreBonus
-            ]
-            rows.append(row)
-        
-        print(f"\nLevel Configuration (Showing levels {display_levels[0]}-{display_levels[-1]} of {len(self.levels)} total)")
-        print("=" * 120)
-        print(tabulate(rows, headers=headers, tablefmt="grid", floatfmt=".2f"))
-        
-        if end_idx < len(sorted_levels):
-            print(f"\n... and {len(sorted_levels) - end_idx} more levels. Use 'view {sorted_levels[end_idx]}' to see more.")
+            key = _prompt_key(f"-- {end_idx}/{total} -- Space/Enter/Down: next, b/Up: back, g/G: first/last, q: quit")
+            if key in ('q', 'Q', '\x1b', ''):
+                return
+            elif key == 'b':
+                start_idx = max(0, start_idx - max_rows)
+            elif key == 'g':
+                start_idx = 0
+            elif key == 'G':
+                start_idx = max(0, total - max_rows)
+            elif end_idx < total:
+                start_idx = end_idx
+            else:
+                return
+    
+    def list_levels(self):
+        """List level numbers, collapsing consecutive runs into ranges"""
+        if not self.levels:
+            print("No levels loaded")
+            return
+        
+        interactive = sys.stdin.isatty() and sys.stdout.isatty()
+        size = shutil.get_terminal_size()
+        page_lines = max(5, size.lines - 2)
+        line = "Available levels: "
+        separator = ""
+        shown = 0
+        for text in _level_ranges(self.sorted_levels):
+            if separator and len(line) + len(separator) + len(text) >= size.columns:
+                print(line + ',')
+                line, separator = "  ", ""
+                shown += 1
+                if interactive and shown % page_lines == 0:
+                    if _prompt_key("-- more -- Space/Enter: next page, q: quit") in ('q', 'Q', '\x1b', ''):
+                        return
+            line += separator + text
+            separator = ", "
+        print(line)
     
     def edit_level(self, level_num: int, field: str, value: str) -> bool:
         """Edit a specific field of a level"""
@@ -230,41 +1483,21 @@ const levelConfigs = {
             print(f"Error: Level {level_num} does not exist")
             return False
         
-        level = self.levels[level_num]
-        
         try:
-            if field == "name":
-                level.name = value
-            elif field == "enemyTypes" or field == "allowedEnemyTypes":
-                # Parse comma-separated list of integers
-                enemy_types = [int(x.strip()) for x in value.split(',')]
-                level.allowedEnemyTypes = enemy_types
-            elif field == "maxEnemies":
-                level.global_config.maxEnemies = int(value)
-            elif field == "spawnTime" or field == "spawnTimeWindow":
-                level.global_config.spawnTimeWindow = float(value)
-            elif field == "collisionSep" or field == "collisionSeparation":
-                level.global_config.collisionSeparation = float(value)
-            elif field == "wrapBuffer":
-                level.global_config.wrapBuffer = int(value)
-            elif field == "speedMult" or field == "speedMultiplier":
-                level.global_config.speedMultiplier = float(value)
-            elif field == "eccentricity" or field == "eccentricityMultiplier":
-                level.global_config.eccentricityMultiplier = float(value)
-            elif field == "scoreBonus":
-                level.global_config.scoreBonus = int(value)
-            else:
-                print(f"Error: Unknown field '{field}'")
-                print("Available fields: name, enemyTypes, maxEnemies, spawnTime, collisionSep, wrapBuffer, speedMult, eccentricity, scoreBonus")
-                return False
-            
-            self.modified = True
-            print(f"Updated level {level_num} {field} to {value}")
-            return True
-            
+            canonical, parsed = parse_field_value(field, value)
+        except KeyError:
+            print(f"Error: Unknown field '{field}'")
+            print("Available fields: name, enemyTypes, maxEnemies, spawnTime, collisionSep, wrapBuffer, speedMult, eccentricity, scoreBonus")
+            return False
         except ValueError as e:
             print(f"Error: Invalid value '{value}' for field '{field}': {e}")
             return False
+        
+        set_level_field(self.levels[level_num], canonical, parsed)
+        self._level_edited(level_num)
+        self.modified = True
+        print(f"Updated level {level_num} {field} to {value}")
+        return True
     
     def add_level(self, level_num: int) -> bool:
         """Add a new level with default values"""
@@ -290,6 +1523,7 @@ const levelConfigs = {
         )
         
         self.levels[level_num] = level_config
+        self._index_add(level_num)
         self.modified = True
         print(f"Added new level {level_num}")
         return True
@@ -301,6 +1535,7 @@ const levelConfigs = {
             return False
         
         del self.levels[level_num]
+        self._index_remove(level_num)
         self.modified = True
         print(f"Deleted level {level_num}")
         return True
@@ -334,10 +1569,528 @@ const levelConfigs = {
         )
         
         self.levels[dest] = new_level
+        self._index_add(dest)
         self.modified = True
         print(f"Copied level {source} to level {dest}")
         return True
     
+    def diff_file(self, filename: str) -> bool:
+        """Show field-level changes from a config file to the loaded levels"""
+        try:
+            other = read_level_records(filename)
+        except FileNotFoundError:
+            print(f"Error: File {filename} not found")
+            return False
+        except ValueError as e:
+            print(f"Error: {e}")
+            return False
+        
+        changes = diff_level_records(other, levels_to_records(self.levels))
+        if not changes:
+            print(f"No differences from {filename}")
+        for change in changes:
+            print(format_change(*change))
+        return True
+    
+    def merge_files(self, base_file: str, their_file: str) -> bool:
+        """Three-way merge another version of the config into the loaded levels"""
+        try:
+            base = read_level_records(base_file)
+            theirs = read_level_records(their_file)
+        except FileNotFoundError as e:
+            print(f"Error: File {e.filename} not found")
+            return False
+        except ValueError as e:
+            print(f"Error: {e}")
+            return False
+        
+        ours = levels_to_records(self.levels)
+        merged, conflicts = merge_level_records(base, ours, theirs)
+        
+        for level_num in _changed_levels(ours, merged):
+            if level_num in merged:
+                self.levels[level_num] = record_to_level(merged[level_num])
+            else:
+                del self.levels[level_num]
+                
+        if merged != ours:
+            self._index_levels()
+            self.modified = True
+        
+        print(f"Merged {their_file} into current levels ({len(conflicts)} conflicts, kept current value)")
+        for conflict in conflicts:
+            print(format_change(*conflict))
+        return True
+    
+    def handle_trace_command(self, args: List[str]) -> bool:
+        """Record, inspect and replay headless enemy traces"""
+        usage = ("Usage: trace record <level> <file> [seed] [seconds] | trace info <file> | "
+                 "trace frame <file> <second> | trace heatmap <file> [start_sec] [end_sec] | trace play <file>")
+        if len(args) < 2:
+            print(usage)
+            return False
+        
+        sub = args[0]
+        try:
+            if sub == 'record':
+                if len(args) < 3:
+                    print(usage)
+                    return False
+                level_num = int(args[1])
+                if level_num not in self.levels:
+                    print(f"Error: Level {level_num} does not exist")
+                    return False
+                seed = int(args[3]) if len(args) > 3 else 0
+                seconds = float(args[4]) if len(args) > 4 else None
+                ticks = record_trace(self.levels[level_num], level_num, args[2], seed, seconds)
+                size = os.path.getsize(args[2])
+                print(f"Recorded {ticks} ticks of level {level_num} (seed {seed}) to {args[2]} ({size / 1024:.1f} KiB)")
+                return True
+            
+            with TraceReader(args[1]) as trace:
+                meta = trace.metadata
+                if sub == 'info':
+                    summary = trace.summary()
+                    print(f"Level {meta['level']} '{meta['name']}', seed {meta['seed']}, {meta['slots']} enemies")
+                    print(f"  Duration:        {summary['seconds']:.1f}s ({summary['ticks']} ticks)")
+                    print(f"  Alive enemies:   peak {summary['peak_alive']}, mean {summary['mean_alive']:.1f}")
+                    print(f"  Spawn blocked:   {summary['player_blocked_seconds']:.1f}s with an enemy on the player spawn point")
+                    types = ', '.join(f"type {t}: {n}" for t, n in summary['type_counts'].items())
+                    print(f"  Enemy types:     {types}")
+                elif sub == 'frame':
+                    tick = int(float(args[2]) * TICKS_PER_SECOND) if len(args) > 2 else 0
+                    enemies = trace.frame(tick)
+                    print(f"Tick {tick} ({tick / TICKS_PER_SECOND:.2f}s): {len(enemies)} enemies alive")
+                    for slot, enemy_type, x, y in enemies:
+                        print(f"  #{slot:<3} type {enemy_type}  x={x:7.1f}  y={y:7.1f}")
+                elif sub == 'heatmap':
+                    start = int(float(args[2]) * TICKS_PER_SECOND) if len(args) > 2 else 0
+                    end = int(float(args[3]) * TICKS_PER_SECOND) if len(args) > 3 else None
+                    print("+" + "-" * 40 + "+")
+                    for line in render_heatmap(trace.heatmap(40, 25, start, end)):
+                        print("|" + line + "|")
+                    print("+" + "-" * 40 + "+")
+                elif sub == 'play':
+                    curses.wrapper(self.run_trace_player, trace)
+                else:
+                    print(usage)
+                    return False
+            return True
+        
+        except FileNotFoundError as e:
+            print(f"Error: File {e.filename} not found")
+        except ValueError as e:
+            print(f"Error: {e}")
+        except KeyboardInterrupt:
+            if sub == 'record':
+                print(f"\nRecording interrupted; partial trace {args[2]} discarded")
+            else:
+                print("\nInterrupted")
+        return False
+    
+    def run_trace_player(self, stdscr, trace: 'TraceReader'):
+        """Curses replay of a trace: space pauses, left/right scrub one second, q quits"""
+        curses.curs_set(0)
+        stdscr.timeout(1000 // 30)
+        tick = 0
+        playing = True
+        
+        while True:
+            max_y, max_x = stdscr.getmaxyx()
+            rows, cols = max(1, max_y - 2), max(1, max_x - 1)
+            stdscr.erase()
+            
+            enemies = trace.frame(tick)
+            for _, enemy_type, x, y in enemies:
+                row = int(y / CANVAS_HEIGHT * rows)
+                col = int(x / CANVAS_WIDTH * cols)
+                if 0 <= row < rows and 0 <= col < cols:
+                    try:
+                        stdscr.addstr(row, col, str(enemy_type))
+                    except curses.error:
+                        pass
+            
+            status = (f"{tick / TICKS_PER_SECOND:6.1f}s / {trace.ticks / TICKS_PER_SECOND:.1f}s | "
+                      f"{len(enemies)} alive | {'PLAY' if playing else 'PAUSE'} | "
+                      "Space: play/pause, Left/Right: -/+1s, Home: start, q: quit")
+            try:
+                stdscr.addstr(max_y - 1, 0, status[:max_x - 1])
+            except curses.error:
+                pass
+            stdscr.refresh()
+            
+            key = stdscr.getch()
+            if key == ord('q'):
+                break
+            elif key == ord(' '):
+                playing = not playing
+            elif key == curses.KEY_RIGHT:
+                tick += TICKS_PER_SECOND
+            elif key == curses.KEY_LEFT:
+                tick -= TICKS_PER_SECOND
+            elif key == curses.KEY_HOME:
+                tick = 0
+            
+            if playing:
+                tick += TICKS_PER_SECOND // 30
+            if tick >= trace.ticks - 1:
+                playing = False
+            tick = max(0, min(trace.ticks - 1, tick))
+    
+    def export_file(self, filename: str) -> bool:
+        """Export all levels to CSV (.csv) or the columnar binary format"""
+        if not self.levels:
+            print("No levels loaded")
+            return False
+        try:
+            count = export_levels(self.levels, filename)
+        except (OSError, TypeError) as e:
+            print(f"Error exporting to {filename}: {e}")
+            return False
+        print(f"Exported {count} levels to {filename}")
+        return True
+    
+    def import_file(self, filename: str, max_errors: int = 20) -> bool:
+        """Replace the loaded levels with a CSV or columnar export, skipping bad rows"""
+        levels: Dict[int, LevelConfig] = {}
+        errors = 0
+        try:
+            with _gc_paused():
+                for row_num, values, error in iter_level_rows(filename):
+                    try:
+                        if error is not None:
+                            raise ValueError(error)
+                        level_num, level = level_from_row(values)
+                        if level_num in levels:
+                            raise ValueError(f"duplicate level {level_num}")
+                    except ValueError as e:
+                        errors += 1
+                        if errors <= max_errors:
+                            print(f"  Row {row_num}: {e}")
+                        continue
+                    levels[level_num] = level
+        except FileNotFoundError:
+            print(f"Error: File {filename} not found")
+            return False
+        except (OSError, ValueError, csv.Error) as e:
+            print(f"Error importing {filename}: {e}")
+            return False
+        
+        if errors > max_errors:
+            print(f"  ... and {errors - max_errors} more bad rows")
+        
+        self.levels = levels
+        self._index_levels()
+        self.modified = True
+        print(f"Imported {len(levels)} levels from {filename} ({errors} bad rows skipped)")
+        return True
+    
+    def display_scores(self, start_level: int = 1, max_rows: Optional[int] = None):
+        """Page through expected/maximum score per level with campaign running totals"""
+        if not self.levels:
+            print("No levels loaded")
+            return
+        
+        economy = self.scores()
+        total_expected, total_maximum = economy.totals()
+        
+        def render(start_idx, end_idx):
+            lines = [f"\nScore Economy (levels {self.sorted_levels[start_idx]}-{self.sorted_levels[end_idx - 1]} "
+                     f"of {len(economy)}; campaign expected {total_expected:.1f}, maximum {total_maximum})",
+                     SCORE_HEADER, SCORE_SEPARATOR]
+            lines.extend(format_score_row(self.levels[row[0]], row)
+                         for row in islice(economy.rows(start_idx), end_idx - start_idx))
+            return lines
+        
+        if total_maximum > SCORE_DISPLAY_LIMIT:
+            print(f"Warning: campaign maximum {total_maximum} overflows the {len(str(SCORE_DISPLAY_LIMIT))}-digit score display")
+        self._page_levels(start_level, max_rows, render, 'score')
+    
+    def export_score_file(self, filename: str) -> bool:
+        """Export the score economy to CSV (.csv) or the columnar binary format"""
+        if not self.levels:
+            print("No levels loaded")
+            return False
+        try:
+            count = export_scores(self.scores(), filename)
+        except OSError as e:
+            print(f"Error exporting to {filename}: {e}")
+            return False
+        print(f"Exported scores for {count} levels to {filename}")
+        return True
+    
+    def check_high_scores(self, entries: List[Dict[str, Any]]) -> int:
+        """Report leaderboard entries the loaded campaign cannot produce; returns how many"""
+        economy = self.scores()
+        bad = 0
+        for entry in entries:
+            try:
+                score, level_num = int(entry['score']), int(entry['level'])
+            except (TypeError, ValueError):
+                print(f"  {entry.get('name', '?')}: unreadable entry {entry}")
+                bad += 1
+                continue
+            problem = check_high_score(economy, score, level_num)
+            if problem:
+                print(f"  {entry.get('name', '?')}: {problem}")
+                bad += 1
+        print(f"{len(entries) - bad} of {len(entries)} high scores are achievable in this campaign")
+        return bad
+    
+    def handle_score_command(self, args: List[str]):
+        usage = "Usage: score [start_level] | score export <file> | score check <high_scores.json | score level>"
+        if not self.levels:
+            print("No levels loaded")
+            return
+        try:
+            if not args:
+                self.display_scores()
+            elif args[0] == 'export' and len(args) == 2:
+                self.export_score_file(args[1])
+            elif args[0] == 'check' and len(args) == 3:
+                self.check_high_scores([{'score': int(args[1]), 'level': int(args[2])}])
+            elif args[0] == 'check' and len(args) == 2:
+                try:
+                    entries = read_high_scores(args[1])
+                except FileNotFoundError:
+                    print(f"Error: File {args[1]} not found")
+                    return
+                except ValueError as e:
+                    print(f"Error: {e}")
+                    return
+                self.check_high_scores(entries)
+            elif len(args) == 1:
+                self.display_scores(int(args[0]))
+            else:
+                print(usage)
+        except ValueError:
+            print("Error: Invalid number")
+    
+    def _intern_record(self, record: Tuple) -> Tuple:
+        """Return the shared copy of a record so identical levels are stored once"""
+        shared = self._shared_records.get(record)
+        if shared is None:
+            types = self._shared_type_lists.setdefault(record[1], record[1])
+            shared = (sys.intern(record[0]), types) + record[2:]
+            self._shared_records[shared] = shared
+        return shared
+    
+    def _stash_campaign(self):
+        """Write the active campaign's in-editor state back to the workspace"""
+        if self.active_campaign is None:
+            return
+        campaign = self.workspace[self.active_campaign]
+        campaign.levels = self.levels
+        campaign.sorted_levels = self.sorted_levels
+        if self.current_file:
+            campaign.filename = os.path.realpath(self.current_file)
+        campaign.modified = self.modified
+    
+    def _find_campaign(self, filename: str) -> Optional[str]:
+        """Name of the workspace campaign holding filename, if any"""
+        path = os.path.realpath(filename)
+        for name, campaign in self.workspace.items():
+            if campaign.filename == path:
+                return name
+        return None
+    
+    def _adopt_current_file(self):
+        """Bring a file loaded outside the workspace into it before switching campaigns"""
+        if self.active_campaign is None and self.current_file and self.levels:
+            self.active_campaign = self._campaign_name(os.path.realpath(self.current_file))
+            self.workspace[self.active_campaign] = Campaign(os.path.realpath(self.current_file), {})
+        self._stash_campaign()
+    
+    def _campaign_name(self, filename: str) -> str:
+        base = os.path.splitext(os.path.basename(filename))[0]
+        name = base
+        suffix = 2
+        while name in self.workspace and self.workspace[name].filename != filename:
+            name = f"{base}#{suffix}"
+            suffix += 1
+        return name
+    
+    def open_campaigns(self, patterns: List[str]) -> bool:
+        """Load config files into the workspace in parallel"""
+        filenames = []
+        for pattern in patterns:
+            matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+            matches = [os.path.realpath(f) for f in matches]
+            filenames.extend(f for f in matches if f not in filenames)
+        if not filenames:
+            print("Error: No files matched")
+            return False
+        
+        # The file loaded before the workspace was used joins it as a campaign
+        self._adopt_current_file()
+        
+        # Re-reading an open campaign would drop its unsaved edits, so keep what is open
+        for filename in list(filenames):
+            name = self._find_campaign(filename)
+            if name is not None:
+                print(f"Skipping {filename}: already open as {name}")
+                filenames.remove(filename)
+        if not filenames:
+            return False
+        
+        start = time.perf_counter()
+        if len(filenames) > 1:
+            with ProcessPoolExecutor(max_workers=min(len(filenames), os.cpu_count() or 1)) as pool:
+                results = list(pool.map(_load_campaign_records, filenames))
+        else:
+            results = [_load_campaign_records(filenames[0])]
+        
+        loaded = 0
+        for filename, (records, error) in zip(filenames, results):
+            if error:
+                print(f"Error: {error}")
+                continue
+            name = self._campaign_name(filename)
+            self.workspace[name] = Campaign(filename, {n: self._intern_record(r) for n, r in records.items()})
+            loaded += 1
+        
+        elapsed = time.perf_counter() - start
+        print(f"Opened {loaded} campaigns in {elapsed:.2f}s "
+              f"({len(self._shared_records)} distinct level records shared across the workspace)")
+        return loaded > 0
+    
+    def list_campaigns(self):
+        self._stash_campaign()
+        if not self.workspace:
+            print("Workspace is empty. Use 'ws open <file|pattern> ...' to add campaigns.")
+            return
+        for name, campaign in self.workspace.items():
+            marker = '*' if name == self.active_campaign else ' '
+            count = len(campaign.levels) if campaign.levels is not None else len(campaign.records)
+            flag = ' [MODIFIED]' if campaign.modified else ''
+            print(f"{marker} {name:<20} {count:>8} levels  {campaign.filename}{flag}")
+    
+    def use_campaign(self, name: str) -> bool:
+        """Make a workspace campaign the one being viewed and edited"""
+        if name not in self.workspace:
+            print(f"Error: No campaign named '{name}'")
+            return False
+        self._adopt_current_file()
+        campaign = self.workspace[name]
+        if campaign.levels is None:
+            campaign.levels = campaign.to_levels()
+            campaign.sorted_levels = sorted(campaign.levels.keys())
+            campaign.records = {}
+        self.levels = campaign.levels
+        self.sorted_levels = campaign.sorted_levels
+        self.score_economy = None
+        self.current_file = campaign.filename
+        self.modified = campaign.modified
+        self.active_campaign = name
+        print(f"Switched to {name} ({len(self.levels)} levels from {campaign.filename})")
+        return True
+    
+    def compare_campaigns(self, level_num: int):
+        """Show one level side by side across every campaign"""
+        self._stash_campaign()
+        if not self.workspace:
+            print("Workspace is empty")
+            return
+        width = max(len('Campaign'), *(len(name) for name in self.workspace))
+        print(f"{'Campaign':<{width}} | {VIEW_HEADER}")
+        print(f"{'-' * width}-+-{VIEW_SEPARATOR}")
+        records = {}
+        for name, campaign in self.workspace.items():
+            record = campaign.get_record(level_num)
+            if record is None:
+                print(f"{name:<{width}} | (no level {level_num})")
+                continue
+            records[name] = record
+            print(f"{name:<{width}} | {format_level_row(level_num, record_to_level(record))}")
+        differing = [field for idx, field in enumerate(LEVEL_FIELDS)
+                     if len({record[idx] for record in records.values()}) > 1]
+        print(f"Differs in: {', '.join(differing)}" if differing else "Identical in all campaigns that have it")
+    
+    def edit_all_campaigns(self, level_num: int, field: str, value: str) -> bool:
+        """Apply the same edit to a level in every campaign that has it"""
+        try:
+            canonical, parsed = parse_field_value(field, value)
+        except KeyError:
+            print(f"Error: Unknown field '{field}'")
+            return False
+        except ValueError as e:
+            print(f"Error: Invalid value '{value}' for field '{field}': {e}")
+            return False
+        
+        self._stash_campaign()
+        field_idx = LEVEL_FIELDS.index(canonical)
+        stored = tuple(parsed) if canonical == 'allowedEnemyTypes' else parsed
+        updated = 0
+        for name, campaign in self.workspace.items():
+            if campaign.levels is not None:
+                if level_num not in campaign.levels:
+                    continue
+                set_level_field(campaign.levels[level_num], canonical, list(parsed) if canonical == 'allowedEnemyTypes' else parsed)
+            else:
+                record = campaign.records.get(level_num)
+                if record is None:
+                    continue
+                # Records are shared, so replace rather than mutate
+                new_record = record[:field_idx] + (stored,) + record[field_idx + 1:]
+                campaign.records[level_num] = self._intern_record(new_record)
+            campaign.modified = True
+            updated += 1
+        
+        if self.active_campaign is not None:
+            self.modified = self.workspace[self.active_campaign].modified
+            if level_num in self.levels:
+                self._level_edited(level_num)
+        print(f"Updated level {level_num} {field} to {value} in {updated} campaigns")
+        return updated > 0
+    
+    def save_campaigns(self) -> bool:
+        """Save every modified campaign back to its file"""
+        self._stash_campaign()
+        saved = 0
+        for name, campaign in self.workspace.items():
+            if not campaign.modified:
+                continue
+            try:
+                write_level_configs(campaign.filename, campaign.to_levels())
+            except OSError as e:
+                print(f"Error saving file {campaign.filename}: {e}")
+                continue
+            campaign.modified = False
+            saved += 1
+        if self.active_campaign is not None:
+            self.modified = self.workspace[self.active_campaign].modified
+        print(f"Saved {saved} campaigns")
+        return True
+    
+    def handle_workspace_command(self, args: List[str]):
+        usage = ("Usage: ws open <file|pattern> ... | ws list | ws use <name> | ws compare <level> | "
+                 "ws edit <level> <field> <value> | ws save")
+        if not args:
+            print(usage)
+            return
+        sub = args[0]
+        try:
+            if sub == 'open' and len(args) >= 2:
+                self.open_campaigns(args[1:])
+            elif sub == 'list':
+                self.list_campaigns()
+            elif sub == 'use' and len(args) >= 2:
+                self.use_campaign(args[1])
+            elif sub == 'compare' and len(args) >= 2:
+                self.compare_campaigns(int(args[1]))
+            elif sub == 'edit' and len(args) >= 4:
+                self.edit_all_campaigns(int(args[1]), args[2], ' '.join(args[3:]))
+            elif sub == 'save':
+                self.save_campaigns()
+            else:
+                print(usage)
+        except ValueError:
+            print("Error: Invalid level number")
+    
+    def workspace_modified(self) -> bool:
+        self._stash_campaign()
+        return any(campaign.modified for campaign in self.workspace.values())
+    
     def run_console(self):
         """Main console interface"""
         print("Galaga Level Configuration Editor")
@@ -359,7 +2112,12 @@ const levelConfigs = {
                 cmd = parts[0].lower()
                 
                 if cmd in ['quit', 'exit', 'q']:
-                    if self.modified:
+                    if self.workspace and self.workspace_modified():
+                        response = input("Some campaigns have unsaved changes. Save them before quitting? (y/n): ")
+                        if response.lower() in ['y', 'yes']:
+                            self.save_campaigns()
+                    # Levels loaded outside the workspace are not covered by save_campaigns
+                    if self.active_campaign is None and self.modified:
                         response = input("You have unsaved changes. Save before quitting? (y/n): ")
                         if response.lower() in ['y', 'yes']:
                             if self.current_file:
@@ -384,6 +2142,39 @@ const levelConfigs = {
                     else:
                         self.save_js_file()
                 
+                elif cmd == 'diff':
+                    if len(parts) < 2:
+                        print("Usage: diff <filename>")
+                    else:
+                        self.diff_file(parts[1])
+                
+                elif cmd == 'merge':
+                    if len(parts) < 3:
+                        print("Usage: merge <base_file> <their_file>")
+                    else:
+                        self.merge_files(parts[1], parts[2])
+                
+                elif cmd in ['ws', 'workspace']:
+                    self.handle_workspace_command(parts[1:])
+                
+                elif cmd == 'trace':
+                    self.handle_trace_command(parts[1:])
+                
+                elif cmd == 'score':
+                    self.handle_score_command(parts[1:])
+                
+                elif cmd == 'export':
+                    if len(parts) < 2:
+                        print("Usage: export <filename.csv|filename>")
+                    else:
+                        self.export_file(parts[1])
+                
+                elif cmd == 'import':
+                    if len(parts) < 2:
+                        print("Usage: import <filename>")
+                    else:
+                        self.import_file(parts[1])
+                
                 elif cmd in ['view', 'show', 'display']:
                     if len(parts) >= 2:
                         try:
@@ -439,11 +2230,7 @@ const levelConfigs = {
                             print("Error: Invalid level number")
                 
                 elif cmd == 'list':
-                    if self.levels:
-                        sorted_levels = sorted(self.levels.keys())
-                        print(f"Available levels: {', '.join(map(str, sorted_levels))}")
-                    else:
-                        print("No levels loaded")
+                    self.list_levels()
                 
                 elif cmd in ['spreadsheet', 'grid', 'excel']:
                     if self.levels:
@@ -470,12 +2257,38 @@ Available Commands:
 File Operations:
   load <filename>           - Load level configuration from JavaScript file
   save [filename]           - Save configuration (to current file or new file)
+  diff <filename>           - Show field changes from a file to the loaded levels
+  merge <base> <theirs>     - Three-way merge another version into the loaded levels
+  export <filename>         - Export levels to CSV (.csv) or columnar binary (other names)
+  import <filename>         - Replace levels with a CSV/columnar export, reporting bad rows
 
 Viewing:
-  view [start_level]        - Display spreadsheet view of levels
-  list                      - List all available level numbers
+  view [start_level]        - Page through levels (Space/Down: next, b/Up: back, q: quit)
+  list                      - List all available level numbers as ranges
   spreadsheet               - Launch interactive spreadsheet mode with arrow keys
 
+Score Economy:
+  score [start_level]       - Page through expected/maximum score per level and cumulatively
+  score export <filename>   - Export the score table to CSV (.csv) or columnar binary
+  score check <file.json>   - Flag leaderboard entries (the game's saved high score list)
+                              that exceed the maximum score available through their level
+  score check <score> <level> - Check a single leaderboard entry
+
+Workspace (several config files at once):
+  ws open <file|pattern> ...  - Load config files in parallel (e.g. ws open variants/*.js)
+  ws list                   - List open campaigns (* marks the active one)
+  ws use <name>             - Switch the editor to another campaign
+  ws compare <level>        - Show one level across all campaigns
+  ws edit <level> <field> <value> - Edit a level in every campaign that has it
+  ws save                   - Save all modified campaigns
+
+Simulation Traces:
+  trace record <level> <file> [seed] [seconds]  - Record a seeded headless run of a level
+  trace info <file>         - Summarize a trace (alive counts, blocked spawn time)
+  trace frame <file> <sec>  - List enemy positions at a moment in the trace
+  trace heatmap <file> [start] [end] - Enemy density heatmap over a time range
+  trace play <file>         - Replay a trace (Space: pause, Left/Right: scrub)
+
 Editing:
   edit <level> <field> <value>  - Edit a specific field of a level
   add <level_num>           - Add a new level with default values
@@ -504,7 +2317,9 @@ Examples:
   spreadsheet               - Launch interactive mode
 
 Spreadsheet Mode Controls:
-  Arrow Keys               - Navigate between cells
+  Arrow Keys               - Navigate between cells (columns scroll sideways; Level stays put)
+                             (Spawn/s, Exp Score and Danger are live, read-only metrics;
+                              Danger is computed in the background from a simulated run)
   Enter                    - Edit current cell
   Esc                      - Cancel editing
   s                        - Save changes
@@ -526,6 +2341,16 @@ Navigation:
             stdscr.getch()
             return
         
+        self.live_metrics = LiveMetrics()
+        try:
+            self._run_curses_loop(stdscr)
+        finally:
+            self.live_metrics.close()
+            self.live_metrics = None
+            self._preview = None
+    
+    def _run_curses_loop(self, stdscr):
+        """Draw/input loop for run_curses_interface"""
         # Initialize colors
         curses.start_color()
         curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_CYAN)    # Header
@@ -546,11 +2371,16 @@ Navigation:
         editing = False
         edit_buffer = ""
         
+        # Wake up periodically so finished metrics jobs get drawn
+        stdscr.timeout(METRICS_POLL_MS)
+        
         while True:
-            stdscr.clear()
+            stdscr.erase()
+            max_y, max_x = stdscr.getmaxyx()
+            self.scroll_to_column(current_col, max_x)
             
-            # Get sorted levels for consistent ordering
-            sorted_levels = sorted(self.levels.keys())
+            # Sorted index for consistent ordering
+            sorted_levels = self.sorted_levels
             visible_rows = min(max_y - 4, len(sorted_levels))  # Leave space for header and status
             
             # Adjust top_row if needed
@@ -562,6 +2392,13 @@ Navigation:
             # Draw header
             self.draw_header(stdscr, max_x)
             
+            # Metrics for the row being edited follow the edit buffer as it is typed
+            self._preview = None
+            if editing:
+                preview = self._preview_record(sorted_levels[current_row], current_col, edit_buffer)
+                if preview is not None:
+                    self._preview = (sorted_levels[current_row], preview)
+            
             # Draw data rows
             for i in range(visible_rows):
                 row_idx = top_row + i
@@ -577,7 +2414,7 @@ Navigation:
             
             # Draw status line
             status = f"Level {current_row + 1}/{len(sorted_levels)} | "
-            status += f"Col: {self.columns[current_col]['name']} | "
+            status += f"Col: {self.columns[current_col]['name']} ({current_col + 1}/{len(self.columns)}) | "
             status += "EDITING" if editing else "NAVIGATE"
             status += " | Arrows: move, Enter: edit, Esc: cancel, s: save, q: quit"
             
@@ -592,10 +2429,15 @@ Navigation:
                 except curses.error:
                     pass
             
+            self.live_metrics.retain(set(sorted_levels[top_row:top_row + visible_rows]))
             stdscr.refresh()
             
-            # Handle input
+            # Handle input; while idle only redraw when new metrics have arrived
             key = stdscr.getch()
+            while key == -1 and not self.live_metrics.collect():
+                key = stdscr.getch()
+            if key == -1:
+                continue
             
             if editing:
                 if key == 27:  # ESC
@@ -617,6 +2459,8 @@ Navigation:
                         try:
                             stdscr.addstr(max_y - 1, 0, "Save before quitting? (y/n): ")
                             stdscr.refresh()
+                            # Wait for the answer rather than the metrics poll interval
+                            stdscr.timeout(-1)
                             response = stdscr.getch()
                             if response == ord('y'):
                                 self.save_js_file()
@@ -633,7 +2477,7 @@ Navigation:
                     current_col -= 1
                 elif key == curses.KEY_RIGHT and current_col < len(self.columns) - 1:
                     current_col += 1
-                elif key == ord('\n') or key == ord('\r'):  # Enter to edit
+                elif (key == ord('\n') or key == ord('\r')) and self.columns[current_col]['type'] != 'metric':  # Enter to edit
                     current_value = self.get_cell_value(sorted_levels[current_row], current_col)
                     edit_buffer = str(current_value)
                     editing = True
@@ -652,14 +2496,39 @@ Navigation:
             {'name': 'Speed Mult', 'width': 12, 'field': 'speedMultiplier', 'type': 'float'},
             {'name': 'Eccentricity', 'width': 14, 'field': 'eccentricityMultiplier', 'type': 'float'},
             {'name': 'Score Bonus', 'width': 12, 'field': 'scoreBonus', 'type': 'int'},
+            # Read-only derived metrics (see LiveMetrics)
+            {'name': 'Spawn/s', 'width': 8, 'field': 'spawnRate', 'type': 'metric'},
+            {'name': 'Exp Score', 'width': 10, 'field': 'expectedScore', 'type': 'metric'},
+            {'name': 'Danger', 'width': 8, 'field': 'danger', 'type': 'metric'},
         ]
+        self.left_col = 1  # first scrolled column; Level always stays on screen
+    
+    def visible_columns(self, max_x):
+        """Indices of the columns that fit: Level, then the rest from left_col onwards"""
+        visible = []
+        x_pos = 0
+        for col_idx in [0] + list(range(self.left_col, len(self.columns))):
+            width = self.columns[col_idx]['width']
+            if x_pos >= max_x - width - 1:  # Account for separator
+                break
+            visible.append(col_idx)
+            x_pos += width + 1
+        return visible
+    
+    def scroll_to_column(self, col_idx, max_x):
+        """Scroll horizontally so the cursor column is drawn"""
+        if col_idx == 0:
+            return
+        if col_idx < self.left_col:
+            self.left_col = col_idx
+        while self.left_col < col_idx and col_idx not in self.visible_columns(max_x):
+            self.left_col += 1
     
     def draw_header(self, stdscr, max_x):
         """Draw the column headers"""
         x_pos = 0
-        for i, col in enumerate(self.columns):
-            if x_pos >= max_x - col['width'] - 1:  # Account for separator
-                break
+        visible = self.visible_columns(max_x)
+        for col in (self.columns[col_idx] for col_idx in visible):
             header_text = col['name'][:col['width']].ljust(col['width'])
             try:
                 stdscr.addstr(0, x_pos, header_text, curses.color_pair(1))
@@ -673,9 +2542,7 @@ Navigation:
         # Draw horizontal separator line
         separator_chars = []
         sep_x = 0
-        for i, col in enumerate(self.columns):
-            if sep_x >= max_x - col['width'] - 1:
-                break
+        for col in (self.columns[col_idx] for col_idx in visible):
             # Add dashes for the column width
             separator_chars.extend(["-"] * col['width'])
             # Add cross or vertical line at separator position
@@ -694,10 +2561,9 @@ Navigation:
         """Draw a single level row"""
         x_pos = 0
         
-        for col_idx, col in enumerate(self.columns):
-            if x_pos >= max_x - col['width'] - 1:  # Account for separator
-                break
-                
+        for col_idx in self.visible_columns(max_x):
+            col = self.columns[col_idx]
+            
             # Get cell value
             if editing and is_current_row and col_idx == current_col:
                 cell_text = edit_buffer
@@ -730,6 +2596,13 @@ Navigation:
         if field == 'level_num':
             return level_num
         
+        if col['type'] == 'metric':
+            if self._preview is not None and self._preview[0] == level_num:
+                record = self._preview[1]
+            else:
+                record = level_to_record(self.levels[level_num])
+            return self.live_metrics.value(field, level_num, record)
+        
         level = self.levels[level_num]
         
         if field in ['name', 'allowedEnemyTypes']:
@@ -742,27 +2615,45 @@ Navigation:
         
         return value
     
+    def parse_cell_value(self, field_type, text):
+        """Parse edited cell text based on the column type"""
+        if field_type == 'int':
+            return int(text)
+        elif field_type == 'float':
+            return _finite_float(text)
+        elif field_type == 'list':
+            # Parse comma-separated integers
+            return [int(x.strip()) for x in text.split(',') if x.strip()]
+        else:  # str
+            return text
+    
+    def _preview_record(self, level_num, col_idx, edit_buffer):
+        """The level's record with the edit buffer applied, or None if it does not parse"""
+        col = self.columns[col_idx]
+        if col['field'] not in LEVEL_FIELDS:
+            return None
+        try:
+            value = self.parse_cell_value(col['type'], edit_buffer)
+        except ValueError:
+            return None
+        if col['type'] == 'list':
+            value = tuple(value)
+        record = level_to_record(self.levels[level_num])
+        idx = LEVEL_FIELDS.index(col['field'])
+        return record[:idx] + (value,) + record[idx + 1:]
+    
     def apply_edit(self, level_num, col_idx, new_value):
         """Apply an edit to a cell"""
         col = self.columns[col_idx]
         field = col['field']
         field_type = col['type']
         
-        # Level number cannot be edited
-        if field == 'level_num':
+        # Level number and derived metrics cannot be edited
+        if field == 'level_num' or field_type == 'metric':
             return False
         
         try:
-            # Parse the new value based on type
-            if field_type == 'int':
-                parsed_value = int(new_value)
-            elif field_type == 'float':
-                parsed_value = float(new_value)
-            elif field_type == 'list':
-                # Parse comma-separated integers
-                parsed_value = [int(x.strip()) for x in new_value.split(',') if x.strip()]
-            else:  # str
-                parsed_value = new_value
+            parsed_value = self.parse_cell_value(field_type, new_value)
             
             # Apply the change
             level = self.levels[level_num]
@@ -772,6 +2663,7 @@ Navigation:
             else:
                 setattr(level.global_config, field, parsed_value)
             
+            self._level_edited(level_num)
             self.modified = True
             return True
             
@@ -785,7 +2677,55 @@ Navigation:
         except KeyboardInterrupt:
             pass
 
+def run_merge_tool(argv: List[str]) -> int:
+    """Non-interactive diff/merge, usable as a git merge driver.
+
+    level_editor.py diff <old.js> <new.js>
+    level_editor.py merge <base.js> <ours.js> <theirs.js> [output.js]
+
+    merge writes to ours.js unless an output file is given, so it can be
+    registered with `driver = python3 level_editor.py merge %O %A %B`.
+    Exit status is 0 when clean, 1 on differences/conflicts and 2 on errors.
+    """
+    cmd, files = argv[0], argv[1:]
+    expected = 2 if cmd == 'diff' else 3
+    if len(files) < expected:
+        print(run_merge_tool.__doc__, file=sys.stderr)
+        return 2
+    
+    # Parsing dominates on big files and the versions are independent, so
+    # read them side by side when there is more than one core to use
+    workers = min(expected, os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_load_campaign_records, files[:expected]))
+    else:
+        results = [_load_campaign_records(f) for f in files[:expected]]
+    errors = [error for _, error in results if error]
+    for error in errors:
+        print(f"Error: {error}", file=sys.stderr)
+    if errors:
+        return 2
+    versions = [records for records, _ in results]
+    
+    if cmd == 'diff':
+        changes = diff_level_records(*versions)
+        for change in changes:
+            print(format_change(*change))
+        return 1 if changes else 0
+    
+    with _gc_paused():
+        merged, conflicts = merge_level_records(*versions)
+        output = files[3] if len(files) > 3 else files[1]
+        write_level_configs(output, {n: record_to_level(r) for n, r in merged.items()})
+    for conflict in conflicts:
+        print(format_change(*conflict), file=sys.stderr)
+    return 1 if conflicts else 0
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] in ('diff', 'merge'):
+        sys.exit(run_merge_tool(sys.argv[1:]))
+    
     editor = LevelEditor()
     
     # Always try to load level_config.js from the same directory as this script